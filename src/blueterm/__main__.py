@@ -1,11 +1,11 @@
 """Entry point for blueterm application"""
-import sys
 import os
+import sys
 from pathlib import Path
-from icecream import ic, install
 
+from .api.exceptions import AuthenticationError, ConfigurationError
 from .app import BluetermApp
-from .api.exceptions import ConfigurationError, AuthenticationError
+from .log_writer import log_always, start_log_writer
 
 
 def setup_logging(debug: bool = False):
@@ -15,37 +15,34 @@ def setup_logging(debug: bool = False):
     Args:
         debug: If True, enable verbose debug logging
     """
+    from icecream import ic
+
     log_dir = Path.home() / ".blueterm"
+    # The app's stdlib logging FileHandler opens its file immediately, so the
+    # directory must exist up front; the log files themselves are opened by
+    # the writer thread on first write
     log_dir.mkdir(exist_ok=True)
     log_file = log_dir / "blueterm.log"
     debug_log_file = log_dir / "debug.log" if debug else None
     
-    # File-only output function (no console output)
-    def file_only_output(s):
-        try:
-            # Always write to main log file
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(s + "\n")
-            
-            # Also write to debug log if debug mode
-            if debug and debug_log_file:
-                with open(debug_log_file, "a", encoding="utf-8") as f:
-                    f.write(s + "\n")
-        except Exception as e:
-            # Only print errors to stderr if we can't write logs
-            print(f"Warning: Failed to write to log file: {e}", file=sys.stderr)
-    
-    # Configure with context for better debugging
-    ic.configureOutput(
-        outputFunction=file_only_output,
-        includeContext=debug,  # Only include context in debug mode
-        argToStringFunction=lambda x: str(x)[:200] if not debug else str(x)  # Truncate in non-debug
-    )
+    # File-only output: ic() just enqueues, a background thread does the I/O
+    log_paths = [log_file, debug_log_file] if debug and debug_log_file else [log_file]
+    writer = start_log_writer(*log_paths)
     
-    # Write initial log message (to file only)
-    ic(f"Logging initialized. Log file: {log_file}, Debug: {debug}")
     if debug:
+        # Configure with context for better debugging
+        ic.configureOutput(
+            outputFunction=writer.write,
+            includeContext=True,
+            argToStringFunction=repr,
+        )
+        ic.enable()
+        ic(f"Logging initialized. Log file: {log_file}, Debug: {debug}")
         ic(f"Debug log file: {debug_log_file}")
+    else:
+        # Short-circuit ic() so release builds skip arg formatting entirely;
+        # errors and warnings are written with log_always() instead
+        ic.disable()
     
     return log_file
 
@@ -63,22 +60,22 @@ def main():
     log_file = setup_logging(debug=debug)
     
     try:
-        ic("Starting Blueterm application", f"Debug mode: {debug}")
+        log_always(f"Starting Blueterm application (debug mode: {debug})")
         app = BluetermApp()
         app.run()
     except (ConfigurationError, AuthenticationError) as e:
-        ic(f"Configuration Error: {e}")
+        log_always(f"Configuration Error: {e}")
         print(f"Configuration Error: {e}", file=sys.stderr)
         print("\nPlease ensure IBMCLOUD_API_KEY is set correctly.", file=sys.stderr)
         print("Get your API key from: https://cloud.ibm.com/iam/apikeys", file=sys.stderr)
         print(f"Check logs at: {log_file}", file=sys.stderr)
         sys.exit(1)
     except KeyboardInterrupt:
-        ic("Application interrupted by user")
+        log_always("Application interrupted by user")
         print("\nExiting blueterm...")
         sys.exit(0)
     except Exception as e:
-        ic(f"Unexpected error: {e}")
+        log_always(f"Unexpected error: {e}")
         print(f"Unexpected error: {e}", file=sys.stderr)
         print(f"Check logs at: {log_file}", file=sys.stderr)
         sys.exit(1)
@@ -1,17 +1,17 @@
 """API client exports"""
 from .client import IBMCloudClient
-from .iks_client import IKSClient
-from .roks_client import ROKSClient
 from .code_engine_client import CodeEngineClient
-from .resource_manager_client import ResourceManagerClient
-from .models import Region, Instance, InstanceStatus, ResourceGroup
 from .exceptions import (
-    BluetermException,
     AuthenticationError,
+    BluetermException,
     ConfigurationError,
-    RegionError,
     InstanceError,
+    RegionError,
 )
+from .iks_client import IKSClient
+from .models import Instance, InstanceStatus, Region, ResourceGroup
+from .resource_manager_client import ResourceManagerClient
+from .roks_client import ROKSClient
 
 __all__ = [
     "IBMCloudClient",
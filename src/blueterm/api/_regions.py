@@ -0,0 +1,157 @@
+"""Shared, cached lookup of the VPC region list used by the non-VPC clients"""
+import asyncio
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from ..log_writer import log_always
+from .cache import TTLCache
+from .http import REQUEST_TIMEOUT
+from .models import Region
+
+REGIONS_TTL_SECONDS = 3600  # Regions almost never change
+
+# Raw VPC region dicts per API key, shared by every client in the process.
+# Both caches are keyed by a hash of the API key, never the key itself.
+_regions_cache = TTLCache(maxsize=4)
+# ETag of the cached region list per API key, for conditional revalidation
+_regions_etags: Dict[str, str] = {}
+
+# VPC service per API key, built on first use and reused so its IAM token
+# and connection pool survive between region lookups
+_vpc_services: Dict[str, Any] = {}
+_vpc_services_lock = threading.Lock()
+
+
+def _key_hash(api_key: str) -> str:
+    """Hash an API key for use as a cache key"""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _get_vpc_service(api_key: str) -> Any:
+    """
+    Get the shared us-south VPC service for an API key, creating it once
+
+    Args:
+        api_key: IBM Cloud API key
+
+    Returns:
+        VpcV1 service pointed at the us-south endpoint
+    """
+    key_hash = _key_hash(api_key)
+    service = _vpc_services.get(key_hash)
+    if service is not None:
+        return service
+
+    with _vpc_services_lock:
+        service = _vpc_services.get(key_hash)
+        if service is None:
+            # Imported here so the stub clients still load without the VPC SDK
+            from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+            from ibm_vpc import VpcV1
+
+            version_date = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+            service = VpcV1(authenticator=IAMAuthenticator(api_key), version=version_date)
+            service.set_http_config({"timeout": REQUEST_TIMEOUT})
+            # Use us-south endpoint to get all regions
+            service.set_service_url("https://us-south.iaas.cloud.ibm.com/v1")
+            _vpc_services[key_hash] = service
+        return service
+
+
+def fetch_vpc_regions(api_key: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Fetch the raw VPC region list from the us-south endpoint
+
+    Code Engine and IKS are available in the VPC regions, so their clients
+    map this list onto their own endpoints. The result is cached for
+    REGIONS_TTL_SECONDS and shared between clients, so only the first caller
+    pays for the IAM token exchange and the API round trip. Once it expires,
+    the list is revalidated with If-None-Match, so an unchanged list costs a
+    304 instead of the full body.
+
+    This call blocks; run it with asyncio.to_thread from async code.
+
+    Args:
+        api_key: IBM Cloud API key
+        force_refresh: Bypass the cache and fetch from the API
+
+    Returns:
+        List of region dicts as returned by the VPC API
+
+    Raises:
+        Exception: If the SDK is unavailable or the API call fails
+    """
+    key_hash = _key_hash(api_key)
+    cache_key = ("vpc_regions", key_hash)
+    if not force_refresh:
+        cached: Optional[List[Dict[str, Any]]] = _regions_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    from ibm_cloud_sdk_core import ApiException
+
+    service = _get_vpc_service(api_key)
+    stale: Optional[List[Dict[str, Any]]] = _regions_cache.get_stale(cache_key)
+    etag = _regions_etags.get(key_hash) if stale is not None else None
+    try:
+        if etag:
+            response = service.list_regions(headers={"If-None-Match": etag})
+        else:
+            response = service.list_regions()
+    except ApiException as e:
+        if e.code != 304 or stale is None:
+            raise
+        # Unchanged since the last fetch; keep the cached list for another TTL
+        _regions_cache.set(cache_key, stale, REGIONS_TTL_SECONDS)
+        return stale
+
+    regions: List[Dict[str, Any]] = response.get_result()["regions"]
+    new_etag = (response.get_headers() or {}).get("ETag")
+    if new_etag:
+        _regions_etags[key_hash] = new_etag
+    else:
+        _regions_etags.pop(key_hash, None)
+
+    _regions_cache.set(cache_key, regions, REGIONS_TTL_SECONDS)
+    return regions
+
+
+async def list_service_regions(
+    api_key: str,
+    endpoints: Mapping[str, str],
+    fallback: Sequence[Region],
+    force_refresh: bool = False
+) -> List[Region]:
+    """
+    List the VPC regions a service is available in, with its endpoints
+
+    Args:
+        api_key: IBM Cloud API key
+        endpoints: Map of region name to the service's endpoint there
+        fallback: Regions to return if the VPC API is unavailable
+        force_refresh: Bypass the cache and fetch from the API
+
+    Returns:
+        List of Region objects sorted by name
+    """
+    # Try to get regions from VPC API if available, otherwise use known regions
+    try:
+        vpc_regions = await asyncio.to_thread(fetch_vpc_regions, api_key, force_refresh)
+        regions = [
+            Region(
+                name=region_data["name"],
+                endpoint=endpoints[region_data["name"]],
+                status=region_data.get("status", "available")
+            )
+            for region_data in vpc_regions
+            if region_data["name"] in endpoints
+        ]
+        if regions:
+            return sorted(regions, key=attrgetter("name"))
+    except Exception as e:
+        log_always(f"Failed to fetch regions from VPC API, using known regions: {e}")
+
+    return list(fallback)
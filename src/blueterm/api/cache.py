@@ -0,0 +1,97 @@
+"""Small in-process LRU cache with per-entry expiry for API responses"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Least-recently-used cache whose entries expire after a per-entry TTL.
+
+    Expired entries are kept (until evicted by size) so callers can fall
+    back to the last known value when a refresh fails.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        """
+        Create an empty cache
+
+        Args:
+            maxsize: Maximum number of entries before the least recently
+                used one is evicted
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value if it has not expired
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() >= entry[0]:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value regardless of expiry
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The last cached value, or None if nothing was cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1] if entry is not None else None
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds until the value expires
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Drop a single entry if present
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, method: Optional[str] = None) -> None:
+        """
+        Drop cached entries
+
+        Args:
+            method: Only drop keys of the form (method, ...); drops
+                everything if not given
+        """
+        with self._lock:
+            if method is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if isinstance(k, tuple) and k[:1] == (method,)]:
+                del self._entries[key]
@@ -1,30 +1,53 @@
 """IBM Cloud VPC API Client Wrapper"""
-from typing import List, Optional, Dict, Any
+import asyncio
+import threading
+import time
 from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
 
-from ibm_vpc import VpcV1
-from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+import requests
 from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+from ibm_vpc import VpcV1
+from icecream import ic
+
+from ..log_writer import log_always
+from ._regions import fetch_vpc_regions
+from .cache import TTLCache
+from .exceptions import AuthenticationError, InstanceError, RegionError
+from .http import REQUEST_TIMEOUT
+from .models import Instance, InstanceStatus, Region
 
-from .models import Region, Instance, InstanceStatus
-from .exceptions import AuthenticationError, RegionError, InstanceError
+
+def _err_msg(e: Exception) -> str:
+    """Get the API error message from an ApiException, or str(e) for other errors"""
+    return getattr(e, "message", None) or str(e)
 
 
 class IBMCloudClient:
     """
     Wrapper around IBM VPC SDK with automatic token refresh,
     region management, and error handling.
+
+    The SDK is synchronous, so API calls run in a worker thread via
+    asyncio.to_thread and the coroutines genuinely yield while waiting.
     """
 
-    TOKEN_LIFETIME_MINUTES = 20  # IAM tokens expire after 20 minutes
-    TOKEN_REFRESH_BUFFER_MINUTES = 2  # Refresh 2 minutes before expiry
+    _REGION_URL_TEMPLATE = "https://{}.iaas.cloud.ibm.com/v1"
 
-    def __init__(self, api_key: str):
+    TOKEN_REFRESH_BUFFER_MINUTES = 5  # Refresh 5 minutes before the IAM token expires
+    REGIONS_TTL_SECONDS = 3600  # Regions almost never change
+    INSTANCES_TTL_SECONDS = 15  # Collapse repeated refreshes of the same region
+
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None):
         """
         Initialize client with IBM Cloud API key
 
         Args:
             api_key: IBM Cloud API key for authentication
+            session: Pooled HTTP session for the VPC services to share with
+                other clients; each service keeps its own if not given
 
         Raises:
             AuthenticationError: If authentication fails
@@ -32,35 +55,134 @@ class IBMCloudClient:
         self.api_key = api_key
         self._service: Optional[VpcV1] = None
         self._current_region: Optional[str] = None
-        self._last_auth_time: Optional[datetime] = None
+        self._region_urls: Dict[str, str] = {}  # Region name -> service URL
+        # One service per region, all sharing one authenticator (and so one
+        # IAM token), so a region can be queried without switching _service
+        self._authenticator: Optional[IAMAuthenticator] = None
+        self._region_services: Dict[str, VpcV1] = {}
+        self._http_session = session
+        self._auth_lock = threading.Lock()
+        # Monotonic time after which the token must be checked again;
+        # 0.0 until the first token has been fetched
+        self._refresh_deadline = 0.0
+        self._cache = TTLCache()
+        # Instances from the last list_instances call, by ID, so get_instance
+        # can skip the API while the listing is fresh
+        self._instance_index: Dict[str, Instance] = {}
+        self._instance_index_expiry = 0.0  # time.monotonic() deadline
+
+        # Use yesterday's date for API version (common IBM Cloud pattern)
+        self._version_date = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
         self._authenticate()
 
     def _authenticate(self) -> None:
         """Authenticate and create VPC service instance"""
         try:
-            authenticator = IAMAuthenticator(self.api_key)
+            self._authenticator = IAMAuthenticator(self.api_key)
+            # Services built with the previous authenticator are dropped
+            self._region_services = {}
+
+            if self._current_region:
+                self._service = self._region_service(self._current_region)
+            else:
+                self._service = self._new_service()
+        except Exception as e:
+            raise AuthenticationError(f"Failed to authenticate with IBM Cloud: {e}") from e
 
-            # Use yesterday's date for API version (common IBM Cloud pattern)
-            today = datetime.now()
-            version_date = (today - timedelta(days=1)).strftime("%Y-%m-%d")
+    def _new_service(self) -> VpcV1:
+        """Create a VPC service using the shared authenticator"""
+        service = VpcV1(
+            authenticator=self._authenticator,
+            version=self._version_date
+        )
+        if self._http_session is not None:
+            # create_session only retries GETs (and the IAM token POST), so
+            # instance action POSTs through the shared pool are never replayed
+            service.set_http_client(self._http_session)
+        service.set_http_config({"timeout": REQUEST_TIMEOUT})
+        return service
+
+    def _region_service(self, region_name: str) -> VpcV1:
+        """
+        Get the VPC service for a region, creating it on first use
 
-            self._service = VpcV1(
-                authenticator=authenticator,
-                version=version_date
-            )
-            self._last_auth_time = datetime.now()
-        except Exception as e:
-            raise AuthenticationError(f"Failed to authenticate with IBM Cloud: {e}")
+        Args:
+            region_name: Region identifier (e.g., 'us-south', 'eu-gb')
+
+        Returns:
+            VpcV1 service pointed at the region's endpoint
+        """
+        service = self._region_services.get(region_name)
+        if service is None:
+            region_url = self._region_urls.get(region_name)
+            if region_url is None:
+                region_url = self._REGION_URL_TEMPLATE.format(region_name)
+                self._region_urls[region_name] = region_url
+            service = self._new_service()
+            service.set_service_url(region_url)
+            self._region_services[region_name] = service
+        return service
+
+    def _refresh_token(self) -> None:
+        """
+        Fetch a new IAM token for the existing VPC service
+
+        Only the token is replaced, so the services and their HTTP connection
+        pools are kept across token refreshes. The token manager's get_token
+        fetches a new token once the current one is close to expiry. Falls
+        back to a full re-authentication if it cannot be refreshed in place.
+
+        Raises:
+            AuthenticationError: If re-authentication fails
+        """
+        token_manager = self._token_manager()
+        if token_manager is None:
+            self._authenticate()
+            return
+        try:
+            token_manager.get_token()
+        except Exception:
+            self._authenticate()
+
+    def _token_manager(self) -> Optional[Any]:
+        """Get the shared authenticator's IAM token manager, if authenticated"""
+        if self._authenticator is None:
+            return None
+        return getattr(self._authenticator, "token_manager", None)
+
+    def _token_seconds_left(self) -> Optional[float]:
+        """
+        Get the number of seconds until the current IAM token expires
+
+        Taken from the token manager, which records the expiry IAM reported
+        for the token it last fetched.
+
+        Returns:
+            Seconds until expiry, or None if no token has been fetched yet
+        """
+        expire_time = getattr(self._token_manager(), "expire_time", 0)
+        return expire_time - time.time() if expire_time else None
 
     def _check_token_refresh(self) -> None:
         """Refresh authentication if token is about to expire"""
-        if self._last_auth_time:
-            elapsed = datetime.now() - self._last_auth_time
-            elapsed_minutes = elapsed.total_seconds() / 60
-            threshold = self.TOKEN_LIFETIME_MINUTES - self.TOKEN_REFRESH_BUFFER_MINUTES
+        # Hot path: called before every API request, so avoid the lock and
+        # any datetime work while the token is known to be fresh
+        if time.monotonic() < self._refresh_deadline:
+            return
+
+        with self._auth_lock:
+            buffer = self.TOKEN_REFRESH_BUFFER_MINUTES * 60
+            seconds_left = self._token_seconds_left()
+            if seconds_left is None:
+                # No token yet - the SDK requests one on the first API call
+                return
 
-            if elapsed_minutes > threshold:
-                self._authenticate()
+            if seconds_left <= buffer:
+                self._refresh_token()
+                seconds_left = self._token_seconds_left() or 0.0
+
+            self._refresh_deadline = time.monotonic() + seconds_left - buffer
 
     def set_region(self, region_name: str) -> None:
         """
@@ -73,98 +195,160 @@ class IBMCloudClient:
             RegionError: If region is invalid or cannot be set
         """
         try:
-            region_url = f"https://{region_name}.iaas.cloud.ibm.com/v1"
-            self._service.set_service_url(region_url)
+            self._service = self._region_service(region_name)
             self._current_region = region_name
         except Exception as e:
-            raise RegionError(f"Failed to set region {region_name}: {e}")
+            raise RegionError(f"Failed to set region {region_name}: {e}") from e
 
-    async def list_regions(self) -> List[Region]:
+    async def list_regions(self, force_refresh: bool = False) -> List[Region]:
         """
         Fetch all available VPC regions using the default us-south endpoint.
         
         According to IBM Cloud VPC API docs, regions should be listed from
         the default us-south endpoint to get all available regions.
+        Results are cached for REGIONS_TTL_SECONDS.
+
+        The listing goes through the shared us-south service in _regions.py,
+        so this client's region-scoped service URL is never switched and
+        list_instances can run concurrently with it.
+
+        Args:
+            force_refresh: Bypass the cache and fetch from the API
 
         Returns:
             List of Region objects sorted by name
 
         Raises:
-            RegionError: If regions cannot be fetched
+            RegionError: If regions cannot be fetched and none are cached
         """
-        self._check_token_refresh()
+        cache_key = ("list_regions",)
+        if not force_refresh:
+            cached: Optional[List[Region]] = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            # Save current region to restore later
-            original_region = self._current_region
-            original_url = self._service.service_url if hasattr(self._service, 'service_url') else None
-            
-            # Use us-south endpoint to list all regions (as per API docs)
-            us_south_url = "https://us-south.iaas.cloud.ibm.com/v1"
-            self._service.set_service_url(us_south_url)
-            
-            response = self._service.list_regions()
-            result = response.get_result()
-            regions = []
-            
+            result = await asyncio.to_thread(fetch_vpc_regions, self.api_key, force_refresh)
+
             # Log the raw response for debugging
-            from icecream import ic
-            ic(f"VPC API returned {len(result.get('regions', []))} regions")
-            
-            for region_data in result.get('regions', []):
-                regions.append(Region(
+            ic(f"VPC API returned {len(result)} regions")
+
+            regions = [
+                Region(
                     name=region_data['name'],
                     endpoint=region_data['endpoint'],
                     status=region_data['status']
-                ))
-            
-            ic(f"Parsed {len(regions)} regions: {[r.name for r in regions]}")
-            
-            # Restore original region/URL if it was set
-            if original_url:
-                self._service.set_service_url(original_url)
-            elif original_region:
-                self.set_region(original_region)
-            
-            return sorted(regions, key=lambda r: r.name)
+                )
+                for region_data in result
+            ]
+
+            regions = sorted(regions, key=attrgetter("name"))
+            self._cache.set(cache_key, regions, self.REGIONS_TTL_SECONDS)
+            return regions
         except ApiException as e:
-            raise RegionError(f"Failed to list regions: {e.message if hasattr(e, 'message') else e}")
+            stale: Optional[List[Region]] = self._cache.get_stale(cache_key)
+            if stale is not None:
+                log_always(f"Failed to list regions, using cached regions: {e}")
+                return stale
+            raise RegionError(f"Failed to list regions: {_err_msg(e)}") from e
         except Exception as e:
-            raise RegionError(f"Unexpected error listing regions: {e}")
+            raise RegionError(f"Unexpected error listing regions: {e}") from e
 
-    async def list_instances(self, region: Optional[str] = None) -> List[Instance]:
+    async def list_instances(
+        self,
+        region: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> List[Instance]:
         """
         Fetch all VPC instances in the current or specified region
 
+        Results are cached per region for INSTANCES_TTL_SECONDS.
+
         Args:
             region: Optional region to list instances from (switches if different)
+            force_refresh: Bypass the cache and fetch from the API
 
         Returns:
             List of Instance objects
 
         Raises:
-            InstanceError: If instances cannot be fetched
+            InstanceError: If instances cannot be fetched and none are cached
         """
         if region and region != self._current_region:
             self.set_region(region)
 
+        cache_key = ("list_instances", self._current_region)
+        if not force_refresh:
+            cached: Optional[List[Instance]] = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         self._check_token_refresh()
         try:
-            response = self._service.list_instances()
-            instances = []
-            for inst_data in response.get_result()['instances']:
-                instances.append(self._parse_instance(inst_data))
+            instances = await self._fetch_instances(self._service, cache_key)
+            self._instance_index = {instance.id: instance for instance in instances}
+            self._instance_index_expiry = time.monotonic() + self.INSTANCES_TTL_SECONDS
             return instances
         except ApiException as e:
-            raise InstanceError(f"Failed to list instances: {e.message if hasattr(e, 'message') else e}")
+            stale: Optional[List[Instance]] = self._cache.get_stale(cache_key)
+            if stale is not None:
+                log_always(f"Failed to list instances, using cached instances: {e}")
+                return stale
+            raise InstanceError(f"Failed to list instances: {_err_msg(e)}") from e
         except Exception as e:
-            raise InstanceError(f"Unexpected error listing instances: {e}")
+            raise InstanceError(f"Unexpected error listing instances: {e}") from e
 
-    async def get_instance(self, instance_id: str) -> Instance:
+    async def prefetch_instances(self, region_name: str) -> None:
+        """
+        Fill the instance cache for a region without switching to it
+
+        Uses the region's own service, so a prefetch can run while
+        list_instances is in flight for the current region. A later
+        list_instances for the region is then served from the cache.
+
+        Args:
+            region_name: Region identifier (e.g., 'us-south', 'eu-gb')
+
+        Raises:
+            ApiException: If the instances cannot be fetched
+        """
+        cache_key = ("list_instances", region_name)
+        if self._cache.get(cache_key) is not None:
+            return
+
+        self._check_token_refresh()
+        await self._fetch_instances(self._region_service(region_name), cache_key)
+
+    async def _fetch_instances(self, service: VpcV1, cache_key: tuple) -> List[Instance]:
+        """
+        List the instances of a region's service and cache them
+
+        Args:
+            service: VPC service pointed at the region
+            cache_key: Cache key for the region's listing
+
+        Returns:
+            List of Instance objects
+        """
+        response = await asyncio.to_thread(service.list_instances)
+        instances = [
+            self._parse_instance(inst_data)
+            for inst_data in response.get_result()['instances']
+        ]
+        self._cache.set(cache_key, instances, self.INSTANCES_TTL_SECONDS)
+        return instances
+
+    async def get_instance(self, instance_id: str, force_refresh: bool = False) -> Instance:
         """
         Fetch detailed information for a specific instance
 
+        The list_instances response carries every field Instance needs, so
+        an instance from a listing fetched within INSTANCES_TTL_SECONDS is
+        returned without an API call.
+
         Args:
             instance_id: Instance UUID
+            force_refresh: Always fetch the instance from the API
 
         Returns:
             Instance object with full details
@@ -172,14 +356,19 @@ class IBMCloudClient:
         Raises:
             InstanceError: If instance cannot be fetched
         """
+        if not force_refresh and time.monotonic() < self._instance_index_expiry:
+            instance = self._instance_index.get(instance_id)
+            if instance is not None:
+                return instance
+
         self._check_token_refresh()
         try:
-            response = self._service.get_instance(id=instance_id)
+            response = await asyncio.to_thread(self._service.get_instance, id=instance_id)
             return self._parse_instance(response.get_result())
         except ApiException as e:
-            raise InstanceError(f"Failed to get instance {instance_id}: {e.message if hasattr(e, 'message') else e}")
+            raise InstanceError(f"Failed to get instance {instance_id}: {_err_msg(e)}") from e
         except Exception as e:
-            raise InstanceError(f"Unexpected error getting instance: {e}")
+            raise InstanceError(f"Unexpected error getting instance: {e}") from e
 
     async def start_instance(self, instance_id: str) -> Dict[str, Any]:
         """
@@ -242,15 +431,19 @@ class IBMCloudClient:
         """
         self._check_token_refresh()
         try:
-            response = self._service.create_instance_action(
+            response = await asyncio.to_thread(
+                self._service.create_instance_action,
                 instance_id=instance_id,
                 type=action
             )
+            # The instance state is changing - don't serve the old listing
+            self._cache.invalidate("list_instances")
+            self._instance_index_expiry = 0.0
             return response.get_result()
         except ApiException as e:
-            raise InstanceError(f"Failed to {action} instance {instance_id}: {e.message if hasattr(e, 'message') else e}")
+            raise InstanceError(f"Failed to {action} instance {instance_id}: {_err_msg(e)}") from e
         except Exception as e:
-            raise InstanceError(f"Unexpected error during {action}: {e}")
+            raise InstanceError(f"Unexpected error during {action}: {e}") from e
 
     def _parse_instance(self, data: Dict[str, Any]) -> Instance:
         """
@@ -262,28 +455,23 @@ class IBMCloudClient:
         Returns:
             Instance object
         """
+        vpc = data['vpc']
+
         # Extract primary network interface IP
-        primary_ip = None
-        if data.get('primary_network_interface'):
-            pni = data['primary_network_interface']
-            if pni.get('primary_ip'):
-                primary_ip = pni['primary_ip'].get('address')
+        pni = data.get('primary_network_interface')
+        primary_ip = pni['primary_ip'].get('address') if pni and pni.get('primary_ip') else None
 
         # Parse status into enum
-        status_value = data.get('status', 'pending')
-        try:
-            status = InstanceStatus(status_value)
-        except ValueError:
-            # Fallback for unknown statuses
-            status = InstanceStatus.PENDING
+        # Unknown statuses fall back to PENDING
+        status = InstanceStatus.from_value(data.get('status'))
 
         return Instance(
             id=data['id'],
             name=data['name'],
             status=status,
             zone=data['zone']['name'],
-            vpc_name=data['vpc']['name'],
-            vpc_id=data['vpc']['id'],
+            vpc_name=vpc['name'],
+            vpc_id=vpc['id'],
             profile=data['profile']['name'],
             primary_ip=primary_ip,
             created_at=data['created_at'],
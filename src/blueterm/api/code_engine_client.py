@@ -1,14 +1,121 @@
 """IBM Cloud Code Engine API Client"""
-from typing import List, Optional
+import asyncio
+import logging
+import threading
+import time
 from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Type, TypeVar
+from urllib.parse import urlencode
+
 import requests
 from icecream import ic
 
+from ..log_writer import log_always
+from ._regions import list_service_regions
+from .cache import TTLCache
+from .exceptions import AuthenticationError
+from .http import (
+    IAM_TOKEN_HEADERS,
+    IAM_TOKEN_URL,
+    JSON_HEADERS,
+    REQUEST_TIMEOUT,
+    create_session,
+    decode_json,
+)
 from .models import (
-    Region, Instance, InstanceStatus,
-    CodeEngineProject, CodeEngineApp, CodeEngineJob, CodeEngineBuild
+    CodeEngineApp,
+    CodeEngineBuild,
+    CodeEngineJob,
+    CodeEngineProject,
+    Instance,
+    InstanceStatus,
+    Region,
 )
-from .exceptions import AuthenticationError
+
+logger = logging.getLogger(__name__)
+
+# Code Engine API endpoint for a region missing from _CE_ENDPOINTS
+_CE_ENDPOINT_TEMPLATE = "https://api.{}.codeengine.cloud.ibm.com"
+
+# Code Engine API endpoint for each region Code Engine is available in
+_CE_ENDPOINTS = {
+    "us-south": "https://api.us-south.codeengine.cloud.ibm.com",
+    "us-east": "https://api.us-east.codeengine.cloud.ibm.com",
+    "eu-gb": "https://api.eu-gb.codeengine.cloud.ibm.com",
+    "eu-de": "https://api.eu-de.codeengine.cloud.ibm.com",
+    "jp-tok": "https://api.jp-tok.codeengine.cloud.ibm.com",
+    "au-syd": "https://api.au-syd.codeengine.cloud.ibm.com",
+    "br-sao": "https://api.br-sao.codeengine.cloud.ibm.com",
+    "ca-mon": "https://api.ca-mon.codeengine.cloud.ibm.com",
+    "ca-tor": "https://api.ca-tor.codeengine.cloud.ibm.com",
+    "eu-es": "https://api.eu-es.codeengine.cloud.ibm.com",
+    "jp-osa": "https://api.jp-osa.codeengine.cloud.ibm.com",
+}
+
+# Known Code Engine regions, used when the VPC regions API is unavailable
+_CE_FALLBACK_REGIONS = tuple(
+    Region(name=name, endpoint=endpoint, status="available")
+    for name, endpoint in _CE_ENDPOINTS.items()
+)
+
+ProjectResource = TypeVar("ProjectResource", CodeEngineApp, CodeEngineJob, CodeEngineBuild)
+
+
+def _parse_project_resources(
+    model: Type[ProjectResource],
+    items: List[dict],
+    project_id: str
+) -> List[ProjectResource]:
+    """
+    Build app, job or build models from the items of a Code Engine list response
+
+    Args:
+        model: CodeEngineApp, CodeEngineJob or CodeEngineBuild
+        items: Raw resource dicts from the API
+        project_id: Project the resources belong to
+
+    Returns:
+        List of model objects
+    """
+    resources: List[ProjectResource] = []
+    append = resources.append
+    for item in items:
+        get = item.get
+        append(model(
+            id=get("id", ""),
+            name=get("name", ""),
+            project_id=project_id,
+            status=get("status", "ready"),
+            created_at=get("created_at", ""),
+            updated_at=get("updated_at"),
+            entity_tag=get("entity_tag")
+        ))
+    return resources
+
+
+def _project_resource_group(proj_data: dict) -> str:
+    """
+    Get the resource group ID of a raw project dict
+
+    The API returns it as "resource_group_id" or "resource_group".
+
+    Args:
+        proj_data: Project dict from the API
+
+    Returns:
+        Resource group ID, or "" if the project has none
+    """
+    return proj_data.get("resource_group_id") or proj_data.get("resource_group") or ""
+
+
+# Code Engine project status -> InstanceStatus used by the instance table
+_CE_STATUS_MAP = {
+    "active": InstanceStatus.RUNNING,
+    "inactive": InstanceStatus.STOPPED,
+    "creating": InstanceStatus.STARTING,
+    "deleting": InstanceStatus.DELETING,
+    "failed": InstanceStatus.FAILED,
+}
 
 
 class CodeEngineClient:
@@ -18,121 +125,218 @@ class CodeEngineClient:
     Manages Code Engine projects, applications, jobs, and functions.
     """
 
-    def __init__(self, api_key: str):
+    TOKEN_REFRESH_BUFFER_SECONDS = 300  # Refresh 5 minutes before the IAM token expires
+    DEFAULT_TOKEN_LIFETIME_SECONDS = 3600  # Used if IAM omits the token expiry
+    PROJECTS_TTL_SECONDS = 15  # Collapse repeated refreshes of the same region
+    RESOURCES_TTL_SECONDS = 30  # Apps/jobs/builds/secrets while navigating projects
+    PAGE_LIMIT = 100  # Items per page (the API maximum)
+    MAX_PAGES = 50  # Stop following next links after this many pages
+    MAX_CONCURRENT_REQUESTS = 8  # In-flight requests per list_project_resources call
+
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None):
         """
         Initialize Code Engine client with IBM Cloud API key
 
         Args:
             api_key: IBM Cloud API key for authentication
+            session: Pooled HTTP session to share with other clients; a new
+                one is created (and owned by this client) if not given
 
         Raises:
             AuthenticationError: If authentication fails
         """
         self.api_key = api_key
         self._current_region: Optional[str] = None
+        # v2 API root for the current region; us-south until a region is set
+        self._base_url = _CE_ENDPOINTS["us-south"] + "/v2"
         self._resource_group_id: Optional[str] = None
-        self._iam_token: str = None
+        self._iam_token: Optional[str] = None
+        self._auth_headers: Dict[str, str] = {}  # Rebuilt when the token is refreshed
+        self._iam_token_expiry: float = 0.0  # time.monotonic() deadline
+        self._token_lock = threading.Lock()
+        self._owns_session = session is None
+        self._session = session if session is not None else create_session()
+        # The form body of the IAM token request never changes for a client
+        self._iam_token_body = urlencode({
+            "grant_type": "urn:ibm:params:oauth:grant-type:apikey",
+            "apikey": api_key
+        })
+        self._cache = TTLCache()
+        # Per-project resource lists, keyed by (kind, project_id)
+        self._resource_cache = TTLCache(maxsize=256)
+
+    def close(self) -> None:
+        """Close the pooled HTTP session unless it was passed in"""
+        if self._owns_session:
+            self._session.close()
+
+    def _token_valid(self) -> bool:
+        """Check if the cached IAM token exists and is outside the refresh buffer"""
+        return self._iam_token is not None and time.monotonic() < self._iam_token_expiry
+
+    def _cached_token(self) -> Optional[str]:
+        """Get the cached IAM token if it is still valid, else None"""
+        return self._iam_token if self._token_valid() else None
 
     def _get_iam_token(self) -> str:
         """
         Get IAM access token from IBM Cloud
 
+        The token is cached until TOKEN_REFRESH_BUFFER_SECONDS before the
+        expiry reported by IAM, then refreshed. The lock ensures concurrent
+        callers hitting expiry together trigger only one refresh.
+
         Returns:
             IAM access token
 
         Raises:
             AuthenticationError: If token retrieval fails
         """
-        if self._iam_token:
-            return self._iam_token
+        token = self._cached_token()
+        if token is not None:
+            return token
+
+        with self._token_lock:
+            # Another caller may have refreshed while we waited for the lock
+            token = self._cached_token()
+            if token is not None:
+                return token
+
+            try:
+                response = self._session.post(
+                    IAM_TOKEN_URL,
+                    headers=IAM_TOKEN_HEADERS,
+                    data=self._iam_token_body,
+                    timeout=REQUEST_TIMEOUT
+                )
+                response.raise_for_status()
+                data = decode_json(response)
+                token = str(data["access_token"])
+                self._iam_token = token
+                # Sent with every API request; the session may be shared, so
+                # its default headers are left alone
+                self._auth_headers = {**JSON_HEADERS, "Authorization": f"Bearer {token}"}
+                self._iam_token_expiry = (
+                    time.monotonic() + self._token_lifetime(data) - self.TOKEN_REFRESH_BUFFER_SECONDS
+                )
+                return token
+            except Exception as e:
+                raise AuthenticationError(f"Failed to get IAM token: {e}") from e
 
-        try:
-            response = requests.post(
-                "https://iam.cloud.ibm.com/identity/token",
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                data={
-                    "grant_type": "urn:ibm:params:oauth:grant-type:apikey",
-                    "apikey": self.api_key
-                }
+    def _token_lifetime(self, data: dict) -> float:
+        """
+        Get the lifetime in seconds of a token from the IAM token response
+
+        Uses expires_in, falling back to the absolute expiration timestamp
+        and then to DEFAULT_TOKEN_LIFETIME_SECONDS.
+
+        Args:
+            data: Decoded IAM token response
+
+        Returns:
+            Seconds until the token expires
+        """
+        if "expires_in" in data:
+            return float(data["expires_in"])
+        if "expiration" in data:
+            return float(data["expiration"]) - time.time()
+        return self.DEFAULT_TOKEN_LIFETIME_SECONDS
+
+    async def _get_iam_token_async(self) -> str:
+        """
+        Get IAM access token without blocking the event loop
+
+        Returns the cached token directly; only a refresh is run in a
+        worker thread.
+
+        Returns:
+            IAM access token
+        """
+        token = self._cached_token()
+        if token is not None:
+            return token
+        return await asyncio.to_thread(self._get_iam_token)
+
+    async def _get_auth_headers(self) -> Dict[str, str]:
+        """
+        Get the Authorization header for the current IAM token
+
+        Returns:
+            Headers dict, built once per token rather than per request
+
+        Raises:
+            AuthenticationError: If token retrieval fails
+        """
+        await self._get_iam_token_async()
+        return self._auth_headers
+
+    async def _get_all_pages(self, url: str, key: str) -> List[dict]:
+        """
+        GET every page of a Code Engine list endpoint
+
+        Code Engine paginates with an opaque start token returned in
+        next.start, so each page can only be requested once the previous
+        one has arrived. Pages are followed until no next token is returned,
+        or MAX_PAGES is reached (logged as a warning, since results are cut short).
+
+        Args:
+            url: List endpoint URL
+            key: Response field holding the items (e.g. "projects")
+
+        Returns:
+            Items from all pages
+
+        Raises:
+            AuthenticationError: If token retrieval fails
+            requests.exceptions.HTTPError: If a page request fails
+        """
+        items: List[dict] = []
+        params = {"limit": self.PAGE_LIMIT}
+        for _ in range(self.MAX_PAGES):
+            response = await asyncio.to_thread(
+                self._session.get,
+                url,
+                headers=await self._get_auth_headers(),
+                params=params,
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            self._iam_token = response.json()["access_token"]
-            return self._iam_token
-        except Exception as e:
-            raise AuthenticationError(f"Failed to get IAM token: {e}")
+            data = decode_json(response)
+
+            # Some responses are a bare list rather than {key: [...]}
+            if isinstance(data, list):
+                items.extend(data)
+                break
+
+            items.extend(data.get(key, []))
+            start = (data.get("next") or {}).get("start")
+            if not start:
+                break
+            params = {"limit": self.PAGE_LIMIT, "start": start}
+        else:
+            logger.warning(
+                "Stopped after %d pages of %s with more results pending; returning %d %s",
+                self.MAX_PAGES, url, len(items), key
+            )
+        return items
 
-    async def list_regions(self) -> List[Region]:
+    async def list_regions(self, force_refresh: bool = False) -> List[Region]:
         """
         List available Code Engine regions
         
         Code Engine supports the same regions as VPC. We use the VPC API
         to get all available regions, then map them to Code Engine endpoints.
+        The VPC region list is cached process-wide (see _regions.py).
+
+        Args:
+            force_refresh: Bypass the cache and fetch from the API
 
         Returns:
             List of Region objects
         """
-        # Code Engine supports all VPC regions
-        # Map of region names to Code Engine endpoints
-        code_engine_endpoints = {
-            "us-south": "https://api.us-south.codeengine.cloud.ibm.com",
-            "us-east": "https://api.us-east.codeengine.cloud.ibm.com",
-            "eu-gb": "https://api.eu-gb.codeengine.cloud.ibm.com",
-            "eu-de": "https://api.eu-de.codeengine.cloud.ibm.com",
-            "jp-tok": "https://api.jp-tok.codeengine.cloud.ibm.com",
-            "au-syd": "https://api.au-syd.codeengine.cloud.ibm.com",
-            "br-sao": "https://api.br-sao.codeengine.cloud.ibm.com",
-            "ca-mon": "https://api.ca-mon.codeengine.cloud.ibm.com",
-            "ca-tor": "https://api.ca-tor.codeengine.cloud.ibm.com",
-            "eu-es": "https://api.eu-es.codeengine.cloud.ibm.com",
-            "jp-osa": "https://api.jp-osa.codeengine.cloud.ibm.com",
-        }
-        
-        # Try to get regions from VPC API if available, otherwise use known regions
-        try:
-            # Import here to avoid circular dependency
-            from ibm_vpc import VpcV1
-            from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
-            from datetime import datetime, timedelta
-            
-            authenticator = IAMAuthenticator(self.api_key)
-            today = datetime.now()
-            version_date = (today - timedelta(days=1)).strftime("%Y-%m-%d")
-            vpc_service = VpcV1(authenticator=authenticator, version=version_date)
-            
-            # Use us-south endpoint to get all regions
-            vpc_service.set_service_url("https://us-south.iaas.cloud.ibm.com/v1")
-            regions_response = vpc_service.list_regions()
-            
-            regions = []
-            for region_data in regions_response.get_result()["regions"]:
-                region_name = region_data["name"]
-                if region_name in code_engine_endpoints:
-                    regions.append(Region(
-                        name=region_name,
-                        endpoint=code_engine_endpoints[region_name],
-                        status=region_data.get("status", "available")
-                    ))
-            
-            if regions:
-                ic(f"Loaded {len(regions)} Code Engine regions from VPC API")
-                return sorted(regions, key=lambda r: r.name)
-        except Exception as e:
-            ic(f"Failed to fetch regions from VPC API, using known regions: {e}")
-        
-        # Fallback to known regions
-        return [
-            Region(name="us-south", endpoint="https://api.us-south.codeengine.cloud.ibm.com", status="available"),
-            Region(name="us-east", endpoint="https://api.us-east.codeengine.cloud.ibm.com", status="available"),
-            Region(name="eu-gb", endpoint="https://api.eu-gb.codeengine.cloud.ibm.com", status="available"),
-            Region(name="eu-de", endpoint="https://api.eu-de.codeengine.cloud.ibm.com", status="available"),
-            Region(name="jp-tok", endpoint="https://api.jp-tok.codeengine.cloud.ibm.com", status="available"),
-            Region(name="au-syd", endpoint="https://api.au-syd.codeengine.cloud.ibm.com", status="available"),
-            Region(name="br-sao", endpoint="https://api.br-sao.codeengine.cloud.ibm.com", status="available"),
-            Region(name="ca-mon", endpoint="https://api.ca-mon.codeengine.cloud.ibm.com", status="available"),
-            Region(name="ca-tor", endpoint="https://api.ca-tor.codeengine.cloud.ibm.com", status="available"),
-            Region(name="eu-es", endpoint="https://api.eu-es.codeengine.cloud.ibm.com", status="available"),
-            Region(name="jp-osa", endpoint="https://api.jp-osa.codeengine.cloud.ibm.com", status="available"),
-        ]
+        return await list_service_regions(
+            self.api_key, _CE_ENDPOINTS, _CE_FALLBACK_REGIONS, force_refresh
+        )
 
     def set_region(self, region_name: str) -> None:
         """
@@ -142,6 +346,8 @@ class CodeEngineClient:
             region_name: Region identifier (e.g., 'us-south', 'eu-gb')
         """
         self._current_region = region_name
+        endpoint = _CE_ENDPOINTS.get(region_name) or _CE_ENDPOINT_TEMPLATE.format(region_name)
+        self._base_url = endpoint + "/v2"
 
     def set_resource_group(self, resource_group_id: str) -> None:
         """
@@ -152,290 +358,320 @@ class CodeEngineClient:
         """
         self._resource_group_id = resource_group_id
 
-    async def list_projects(self, resource_group_id: Optional[str] = None) -> List[CodeEngineProject]:
+    async def _fetch_projects_raw(
+        self,
+        resource_group_id: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> List[dict]:
         """
-        List Code Engine projects in a resource group or all projects in the region
+        Fetch the raw project dicts in the current region
+
+        Both list_projects and list_instances build their models from this,
+        so each caller constructs one object per project rather than a
+        CodeEngineProject that is then re-wrapped. Results are cached per
+        region and resource group for PROJECTS_TTL_SECONDS. If the API call
+        fails, the last cached result is returned instead of an empty list.
 
         Args:
             resource_group_id: Optional resource group ID (uses set resource group if not provided)
-                              If not provided, lists all projects in the region
+                              If not provided, returns all projects in the region
+            force_refresh: Bypass the cache and fetch from the API
 
         Returns:
-            List of CodeEngineProject objects
+            Project dicts as returned by the API, filtered by resource group
         """
         if not resource_group_id:
             resource_group_id = self._resource_group_id
 
-        try:
-            token = self._get_iam_token()
-            region = self._current_region or "us-south"
+        region = self._current_region or "us-south"
+        cache_key = ("list_projects", region, resource_group_id)
+        if not force_refresh:
+            cached: Optional[List[dict]] = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
+        try:
             # Build API URL
-            url = f"https://api.{region}.codeengine.cloud.ibm.com/v2/projects"
+            url = f"{self._base_url}/projects"
             
             # Code Engine API does NOT support resource_group_id as a query parameter
             # It returns all projects in the region, and we filter client-side if needed
-            params = {
-                "limit": 100
-            }
-            
-            ic(f"Fetching Code Engine projects from {url} (all projects in region)")
-            if resource_group_id:
-                ic(f"Will filter projects by resource_group_id: {resource_group_id} client-side")
-
-            ic(f"API request params: {params}")
-
-            response = requests.get(
-                url,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                    "Accept": "application/json"
-                },
-                params=params
+            logger.debug(
+                "Fetching Code Engine projects from %s (filter resource group: %s)",
+                url, resource_group_id
             )
-            
-            ic(f"Code Engine projects API response status: {response.status_code}")
-            ic(f"Code Engine projects API response URL: {response.url}")
-            
-            response.raise_for_status()
 
-            data = response.json()
-            ic(f"Code Engine projects API response keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
-            
             # The API returns {"projects": [...]} format
-            projects_data = data.get("projects", [])
-            
-            # If projects is not in the response, check if data is a list directly
-            if not projects_data and isinstance(data, list):
-                projects_data = data
-            
-            ic(f"Found {len(projects_data)} projects in API response")
-            
-            projects = []
-            for proj_data in projects_data:
-                # Extract resource group ID from project data
-                # The API returns it as "resource_group_id" or "resource_group"
-                proj_rg_id = proj_data.get("resource_group_id") or proj_data.get("resource_group")
-                
-                # Filter by resource group if specified (API returns all projects, filter client-side)
-                if resource_group_id:
-                    if not proj_rg_id or proj_rg_id != resource_group_id:
-                        ic(f"Skipping project {proj_data.get('name')} - resource group mismatch: {proj_rg_id} != {resource_group_id}")
-                        continue
-                    
-                project = CodeEngineProject(
-                    id=proj_data.get("id", ""),
-                    name=proj_data.get("name", ""),
-                    region=proj_data.get("region", region),
-                    resource_group_id=proj_rg_id or resource_group_id or "",
-                    status=proj_data.get("status", "active"),
-                    created_at=proj_data.get("created_at", ""),
-                    crn=proj_data.get("crn", ""),
-                    entity_tag=proj_data.get("entity_tag")
-                )
-                projects.append(project)
-                ic(f"Added project: {project.name} (resource_group_id: {project.resource_group_id})")
-            
-            ic(f"Loaded {len(projects)} Code Engine projects after filtering")
-            return projects
+            projects_data = await self._get_all_pages(url, "projects")
+
+            # Filter by resource group if specified (API returns all projects, filter client-side)
+            if resource_group_id:
+                projects_data = [
+                    proj_data for proj_data in projects_data
+                    if _project_resource_group(proj_data) == resource_group_id
+                ]
+
+            ic(f"Loaded {len(projects_data)} Code Engine projects after filtering")
+            self._cache.set(cache_key, projects_data, self.PROJECTS_TTL_SECONDS)
+            return projects_data
         except requests.exceptions.HTTPError as e:
-            ic(f"HTTP error fetching Code Engine projects: {e}")
+            log_always(f"HTTP error fetching Code Engine projects: {e}")
             if hasattr(e, 'response') and e.response is not None:
                 ic(f"Response status: {e.response.status_code}")
                 ic(f"Response text: {e.response.text[:500]}")
-            return []
+            return self._stale_projects(cache_key)
         except Exception as e:
-            ic(f"Error fetching Code Engine projects: {e}")
-            import traceback
-            ic(f"Traceback: {traceback.format_exc()}")
+            log_always(f"Error fetching Code Engine projects: {e}")
+            # Traceback is only formatted when debug logging is enabled
+            logger.debug("Error fetching Code Engine projects", exc_info=True)
+            return self._stale_projects(cache_key)
+
+    def _stale_projects(self, cache_key: tuple) -> List[dict]:
+        """
+        Get the last cached project list after a failed fetch
+
+        Args:
+            cache_key: Cache key of the failed _fetch_projects_raw call
+
+        Returns:
+            Cached project dicts, or an empty list if none were cached
+        """
+        stale: Optional[List[dict]] = self._cache.get_stale(cache_key)
+        if stale is None:
             return []
+        ic(f"Using {len(stale)} cached Code Engine projects")
+        return stale
+
+    async def list_projects(
+        self,
+        resource_group_id: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> List[CodeEngineProject]:
+        """
+        List Code Engine projects in a resource group or all projects in the region
 
-    async def list_apps(self, project_id: str) -> List[CodeEngineApp]:
+        Args:
+            resource_group_id: Optional resource group ID (uses set resource group if not provided)
+                              If not provided, lists all projects in the region
+            force_refresh: Bypass the cache and fetch from the API
+
+        Returns:
+            List of CodeEngineProject objects
+        """
+        projects_data = await self._fetch_projects_raw(resource_group_id, force_refresh)
+        region = self._current_region or "us-south"
+
+        projects: List[CodeEngineProject] = []
+        append = projects.append
+        for proj_data in projects_data:
+            get = proj_data.get
+            append(CodeEngineProject(
+                id=get("id", ""),
+                name=get("name", ""),
+                region=get("region", region),
+                resource_group_id=_project_resource_group(proj_data),
+                status=get("status", "active"),
+                created_at=get("created_at", ""),
+                crn=get("crn", ""),
+                entity_tag=get("entity_tag")
+            ))
+        return projects
+
+    async def list_apps(
+        self,
+        project_id: str,
+        force_refresh: bool = False
+    ) -> List[CodeEngineApp]:
         """
         List applications in a Code Engine project
 
         Args:
             project_id: Code Engine project ID
+            force_refresh: Bypass the cache and fetch from the API
 
         Returns:
             List of CodeEngineApp objects
         """
+        cache_key = ("applications", project_id)
+        if not force_refresh:
+            cached: Optional[List[CodeEngineApp]] = self._resource_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            token = self._get_iam_token()
-            region = self._current_region or "us-south"
-
-            response = requests.get(
-                f"https://api.{region}.codeengine.cloud.ibm.com/v2/projects/{project_id}/applications",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
-                params={
-                    "limit": 100
-                }
+            apps_data = await self._get_all_pages(
+                f"{self._base_url}/projects/{project_id}/applications", "applications"
             )
-            response.raise_for_status()
-
-            data = response.json()
-            apps_data = data.get("applications", [])
             
-            apps = []
-            for app_data in apps_data:
-                app = CodeEngineApp(
-                    id=app_data.get("id", ""),
-                    name=app_data.get("name", ""),
-                    project_id=project_id,
-                    status=app_data.get("status", "ready"),
-                    created_at=app_data.get("created_at", ""),
-                    updated_at=app_data.get("updated_at"),
-                    entity_tag=app_data.get("entity_tag")
-                )
-                apps.append(app)
+            apps = _parse_project_resources(CodeEngineApp, apps_data, project_id)
             
-            ic(f"Loaded {len(apps)} applications for project {project_id}")
+            logger.debug("Loaded %d applications for project %s", len(apps), project_id)
+            self._resource_cache.set(cache_key, apps, self.RESOURCES_TTL_SECONDS)
             return apps
         except Exception as e:
-            ic(f"Error fetching Code Engine applications: {e}")
+            log_always(f"Error fetching Code Engine applications: {e}")
             return []
 
-    async def list_jobs(self, project_id: str) -> List[CodeEngineJob]:
+    async def list_jobs(
+        self,
+        project_id: str,
+        force_refresh: bool = False
+    ) -> List[CodeEngineJob]:
         """
         List jobs in a Code Engine project
 
         Args:
             project_id: Code Engine project ID
+            force_refresh: Bypass the cache and fetch from the API
 
         Returns:
             List of CodeEngineJob objects
         """
+        cache_key = ("jobs", project_id)
+        if not force_refresh:
+            cached: Optional[List[CodeEngineJob]] = self._resource_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            token = self._get_iam_token()
-            region = self._current_region or "us-south"
-
-            response = requests.get(
-                f"https://api.{region}.codeengine.cloud.ibm.com/v2/projects/{project_id}/jobs",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
-                params={
-                    "limit": 100
-                }
+            jobs_data = await self._get_all_pages(
+                f"{self._base_url}/projects/{project_id}/jobs", "jobs"
             )
-            response.raise_for_status()
-
-            data = response.json()
-            jobs_data = data.get("jobs", [])
             
-            jobs = []
-            for job_data in jobs_data:
-                job = CodeEngineJob(
-                    id=job_data.get("id", ""),
-                    name=job_data.get("name", ""),
-                    project_id=project_id,
-                    status=job_data.get("status", "ready"),
-                    created_at=job_data.get("created_at", ""),
-                    updated_at=job_data.get("updated_at"),
-                    entity_tag=job_data.get("entity_tag")
-                )
-                jobs.append(job)
+            jobs = _parse_project_resources(CodeEngineJob, jobs_data, project_id)
             
-            ic(f"Loaded {len(jobs)} jobs for project {project_id}")
+            logger.debug("Loaded %d jobs for project %s", len(jobs), project_id)
+            self._resource_cache.set(cache_key, jobs, self.RESOURCES_TTL_SECONDS)
             return jobs
         except Exception as e:
-            ic(f"Error fetching Code Engine jobs: {e}")
+            log_always(f"Error fetching Code Engine jobs: {e}")
             return []
 
-    async def list_builds(self, project_id: str) -> List[CodeEngineBuild]:
+    async def list_builds(
+        self,
+        project_id: str,
+        force_refresh: bool = False
+    ) -> List[CodeEngineBuild]:
         """
         List builds in a Code Engine project
 
         Args:
             project_id: Code Engine project ID
+            force_refresh: Bypass the cache and fetch from the API
 
         Returns:
             List of CodeEngineBuild objects
         """
+        cache_key = ("builds", project_id)
+        if not force_refresh:
+            cached: Optional[List[CodeEngineBuild]] = self._resource_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            token = self._get_iam_token()
-            region = self._current_region or "us-south"
-
-            response = requests.get(
-                f"https://api.{region}.codeengine.cloud.ibm.com/v2/projects/{project_id}/builds",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
-                params={
-                    "limit": 100
-                }
+            builds_data = await self._get_all_pages(
+                f"{self._base_url}/projects/{project_id}/builds", "builds"
             )
-            response.raise_for_status()
-
-            data = response.json()
-            builds_data = data.get("builds", [])
             
-            builds = []
-            for build_data in builds_data:
-                build = CodeEngineBuild(
-                    id=build_data.get("id", ""),
-                    name=build_data.get("name", ""),
-                    project_id=project_id,
-                    status=build_data.get("status", "ready"),
-                    created_at=build_data.get("created_at", ""),
-                    updated_at=build_data.get("updated_at"),
-                    entity_tag=build_data.get("entity_tag")
-                )
-                builds.append(build)
+            builds = _parse_project_resources(CodeEngineBuild, builds_data, project_id)
             
-            ic(f"Loaded {len(builds)} builds for project {project_id}")
+            logger.debug("Loaded %d builds for project %s", len(builds), project_id)
+            self._resource_cache.set(cache_key, builds, self.RESOURCES_TTL_SECONDS)
             return builds
         except Exception as e:
-            ic(f"Error fetching Code Engine builds: {e}")
+            log_always(f"Error fetching Code Engine builds: {e}")
             return []
 
-    async def list_secrets(self, project_id: str) -> List[dict]:
+    async def list_secrets(
+        self,
+        project_id: str,
+        force_refresh: bool = False
+    ) -> List[dict]:
         """
         List secrets in a Code Engine project
 
         Args:
             project_id: Code Engine project ID
+            force_refresh: Bypass the cache and fetch from the API
 
         Returns:
             List of secret dictionaries
         """
+        cache_key = ("secrets", project_id)
+        if not force_refresh:
+            cached: Optional[List[dict]] = self._resource_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
-            token = self._get_iam_token()
-            region = self._current_region or "us-south"
-
-            response = requests.get(
-                f"https://api.{region}.codeengine.cloud.ibm.com/v2/projects/{project_id}/secrets",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
-                params={
-                    "limit": 100
-                }
+            secrets_data = await self._get_all_pages(
+                f"{self._base_url}/projects/{project_id}/secrets", "secrets"
             )
-            response.raise_for_status()
-
-            data = response.json()
-            secrets_data = data.get("secrets", [])
             
-            ic(f"Loaded {len(secrets_data)} secrets for project {project_id}")
+            logger.debug("Loaded %d secrets for project %s", len(secrets_data), project_id)
+            self._resource_cache.set(cache_key, secrets_data, self.RESOURCES_TTL_SECONDS)
             return secrets_data
         except Exception as e:
-            ic(f"Error fetching Code Engine secrets: {e}")
+            log_always(f"Error fetching Code Engine secrets: {e}")
             return []
 
-    async def list_instances(self, region: Optional[str] = None) -> List[Instance]:
+    async def list_project_resources(
+        self,
+        project_ids: List[str],
+        force_refresh: bool = False
+    ) -> Dict[str, Dict[str, list]]:
+        """
+        List apps, jobs, builds and secrets for several projects concurrently
+
+        All requests are issued together but at most MAX_CONCURRENT_REQUESTS
+        are in flight at once, to stay within IBM Cloud rate limits.
+
+        Args:
+            project_ids: Code Engine project IDs
+            force_refresh: Bypass the cache and fetch from the API
+
+        Returns:
+            Dict mapping project_id to {"apps": [...], "jobs": [...], "builds": [...], "secrets": [...]}
+        """
+        listers: Dict[str, Callable[[str, bool], Awaitable[list]]] = {
+            "apps": self.list_apps,
+            "jobs": self.list_jobs,
+            "builds": self.list_builds,
+            "secrets": self.list_secrets,
+        }
+        # Created per call: Textual thread workers each run their own event loop
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        async def fetch(kind: str, project_id: str) -> list:
+            async with semaphore:
+                return await listers[kind](project_id, force_refresh)
+
+        keys = [(project_id, kind) for project_id in project_ids for kind in listers]
+        results = await asyncio.gather(
+            *(fetch(kind, project_id) for project_id, kind in keys),
+            return_exceptions=True
+        )
+
+        resources: Dict[str, Dict[str, list]] = {project_id: {} for project_id in project_ids}
+        for (project_id, kind), result in zip(keys, results):
+            if isinstance(result, BaseException):
+                log_always(f"Error listing {kind} for project {project_id}: {result}")
+                resources[project_id][kind] = []
+            else:
+                resources[project_id][kind] = result
+        return resources
+
+    async def list_instances(
+        self,
+        region: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> List[Instance]:
         """
         List Code Engine projects as Instance objects (for compatibility with existing UI)
 
         Args:
             region: Optional region to list projects from
+            force_refresh: Bypass the project cache and fetch from the API
 
         Returns:
             List of Instance objects representing Code Engine projects
@@ -443,33 +679,26 @@ class CodeEngineClient:
         if region and region != self._current_region:
             self.set_region(region)
 
-        projects = await self.list_projects()
-
-        instances = []
-        for project in projects:
-            # Convert Code Engine project to Instance object for display
-            status_map = {
-                "active": InstanceStatus.RUNNING,
-                "inactive": InstanceStatus.STOPPED,
-                "creating": InstanceStatus.STARTING,
-                "deleting": InstanceStatus.DELETING,
-                "failed": InstanceStatus.FAILED,
-            }
-
-            instance = Instance(
-                id=project.id,
-                name=project.name,
-                status=status_map.get(project.status, InstanceStatus.PENDING),
-                zone=project.region,
+        projects_data = await self._fetch_projects_raw(force_refresh=force_refresh)
+        region = self._current_region or "us-south"
+
+        # Build Instance objects straight from the API data for display
+        instances: List[Instance] = []
+        append = instances.append
+        for proj_data in projects_data:
+            get = proj_data.get
+            append(Instance(
+                id=get("id", ""),
+                name=get("name", ""),
+                status=_CE_STATUS_MAP.get(get("status", "active"), InstanceStatus.PENDING),
+                zone=get("region", region),
                 vpc_name="Code Engine",  # Use service name
-                vpc_id=project.resource_group_id,
+                vpc_id=_project_resource_group(proj_data),
                 profile="Project",  # Resource type
                 primary_ip=None,  # Not applicable for Code Engine
-                created_at=project.created_at,
-                crn=project.crn
-            )
-            instances.append(instance)
-
+                created_at=get("created_at", ""),
+                crn=get("crn", "")
+            ))
         return instances
 
     async def start_instance(self, instance_id: str) -> None:
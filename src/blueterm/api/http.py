@@ -0,0 +1,96 @@
+"""Shared HTTP session factory for the IBM Cloud REST clients"""
+from typing import Any, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# (connect, read) timeout in seconds applied to every request, so a hung
+# endpoint fails the call instead of blocking its worker thread forever
+REQUEST_TIMEOUT = (3.05, 15)
+
+POOL_CONNECTIONS = 16  # Number of distinct hosts to keep pools for
+POOL_MAXSIZE = 32  # Keep-alive connections per host
+
+# IAM API key -> token exchange endpoint and its headers
+IAM_TOKEN_URL = "https://iam.cloud.ibm.com/identity/token"
+IAM_TOKEN_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Headers for JSON API calls; merged into each client's per-request headers
+JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+def create_session() -> requests.Session:
+    """
+    Create a requests Session with connection pooling and retries
+
+    Reusing one session keeps TLS connections to IAM and the service
+    endpoints alive between calls, so only the first request to each host
+    pays for the handshake. Transient 429/5xx responses to GETs are retried
+    inside urllib3 with exponential backoff (honouring Retry-After), so
+    callers only see errors that persist. Other POSTs, such as instance
+    start/stop/reboot actions, are never replayed; only the IAM token
+    exchange, which is safe to repeat, also retries its POST.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json"})
+    session.mount("https://", _pooled_adapter(("GET",)))
+    # Longest prefix wins, so only the token endpoint gets this adapter
+    session.mount(IAM_TOKEN_URL, _pooled_adapter(("GET", "POST")))
+    return session
+
+
+def _pooled_adapter(retry_methods: Tuple[str, ...]) -> HTTPAdapter:
+    """
+    Create a pooled adapter that retries transient failures
+
+    Args:
+        retry_methods: HTTP methods that may be retried
+
+    Returns:
+        Configured HTTPAdapter
+    """
+    retry = Retry(
+        total=4,
+        # A region that refuses connections is down, not busy; retry it once
+        # so it doesn't hold up everything gathered alongside it
+        connect=1,
+        backoff_factor=0.25,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=retry_methods,
+        respect_retry_after_header=True,
+        # Hand back the final response so raise_for_status() reports the
+        # real HTTP error instead of a generic RetryError
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+
+def decode_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body
+
+    Uses orjson when it is installed, which is several times faster than
+    the stdlib json module on large listings.
+
+    Args:
+        response: Response with a JSON body
+
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
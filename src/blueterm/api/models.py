@@ -1,53 +1,76 @@
 """Data models for IBM Cloud VPC resources"""
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Any, NamedTuple, Optional
 
+# dataclass(slots=True) needs Python 3.10+; on 3.9 the models keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-class InstanceStatus(Enum):
-    """VPC instance status values with color mappings for display"""
-    RUNNING = "running"
-    STOPPED = "stopped"
-    STARTING = "starting"
-    STOPPING = "stopping"
-    PENDING = "pending"
-    FAILED = "failed"
-    DELETING = "deleting"
-    RESTARTING = "restarting"
 
-    @property
-    def color(self) -> str:
-        """Return Rich color code for status display"""
-        color_map = {
-            self.RUNNING: "green",
-            self.STOPPED: "red",
-            self.STARTING: "yellow",
-            self.STOPPING: "yellow",
-            self.PENDING: "blue",
-            self.FAILED: "red bold",
-            self.DELETING: "magenta",
-            self.RESTARTING: "yellow"
-        }
-        return color_map.get(self, "white")
+def _intern(value: Any) -> Any:
+    """Intern a string; anything else (e.g. None from a null JSON field) is returned as is"""
+    return sys.intern(value) if isinstance(value, str) else value
 
-    @property
-    def symbol(self) -> str:
-        """Return status symbol for compact display"""
-        symbol_map = {
-            self.RUNNING: "●",
-            self.STOPPED: "○",
-            self.STARTING: "◐",
-            self.STOPPING: "◑",
-            self.PENDING: "◎",
-            self.FAILED: "✗",
-            self.DELETING: "⊗",
-            self.RESTARTING: "↻"
-        }
-        return symbol_map.get(self, "?")
-
-
-@dataclass
-class Region:
+
+class InstanceStatus(Enum):
+    """VPC instance status values with color mappings for display"""
+    # (value, Rich color code, symbol for compact display)
+    RUNNING = ("running", "green", "●")
+    STOPPED = ("stopped", "red", "○")
+    STARTING = ("starting", "yellow", "◐")
+    STOPPING = ("stopping", "yellow", "◑")
+    PENDING = ("pending", "blue", "◎")
+    FAILED = ("failed", "red bold", "✗")
+    DELETING = ("deleting", "magenta", "⊗")
+    RESTARTING = ("restarting", "yellow", "↻")
+
+    # Set per member in __new__; annotation-only names are not members
+    _value_: str
+    color: str
+    symbol: str
+    display: str
+
+    def __new__(cls, value: str, color: str, symbol: str) -> "InstanceStatus":
+        # color and symbol are stored on each member, so reading them while
+        # rendering rows is a plain attribute lookup
+        member = object.__new__(cls)
+        member._value_ = value
+        member.color = color
+        member.symbol = symbol
+        member.display = f"{symbol} {value}"
+        return member
+
+    @classmethod
+    def from_value(cls, value: Optional[str]) -> "InstanceStatus":
+        """
+        Parse an API status string
+
+        A single dict lookup, rather than the Enum constructor, which is
+        slower and raises on unknown values.
+
+        Args:
+            value: Status string from the API
+
+        Returns:
+            Matching status, or PENDING for unknown values
+        """
+        return _STATUS_BY_VALUE.get(value, cls.PENDING)
+
+
+# API status string -> InstanceStatus
+_STATUS_BY_VALUE = {status.value: status for status in InstanceStatus}
+
+
+# Lifecycle actions allowed in each status; statuses not listed allow none
+_ALLOWED_ACTIONS = {
+    InstanceStatus.STOPPED: frozenset({"start"}),
+    InstanceStatus.RUNNING: frozenset({"stop", "reboot"}),
+}
+_NO_ACTIONS: frozenset = frozenset()
+
+
+class Region(NamedTuple):
     """IBM Cloud VPC Region"""
     name: str
     endpoint: str
@@ -60,7 +83,7 @@ class Region:
         return f"Region(name='{self.name}', status='{self.status}')"
 
 
-@dataclass
+@dataclass(repr=False, **_SLOTS)
 class ResourceGroup:
     """IBM Cloud Resource Group"""
     id: str
@@ -68,6 +91,9 @@ class ResourceGroup:
     state: str  # active, inactive, etc.
     crn: str
 
+    def __post_init__(self) -> None:
+        self.state = _intern(self.state)
+
     def __str__(self) -> str:
         return self.name
 
@@ -75,7 +101,7 @@ class ResourceGroup:
         return f"ResourceGroup(name='{self.name}', id='{self.id[:8]}...')"
 
 
-@dataclass
+@dataclass(repr=False, **_SLOTS)
 class Instance:
     """IBM Cloud VPC Instance"""
     id: str
@@ -88,31 +114,34 @@ class Instance:
     primary_ip: Optional[str]
     created_at: str
     crn: str
+    # Shortened ID for display (first 8 characters), derived from id
+    short_id: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def short_id(self) -> str:
-        """Return shortened ID for display (first 8 characters)"""
-        return self.id[:8] if self.id else ""
+    def __post_init__(self) -> None:
+        self.short_id = self.id[:8] if self.id else ""
+        # Zones, VPC names and profiles repeat across a listing; share one
+        # string object per distinct value instead of one per instance
+        self.zone = _intern(self.zone)
+        self.vpc_name = _intern(self.vpc_name)
+        self.profile = _intern(self.profile)
 
-    @property
-    def can_start(self) -> bool:
-        """Check if instance can be started"""
-        return self.status == InstanceStatus.STOPPED
+    def can(self, action: str) -> bool:
+        """
+        Check if a lifecycle action is allowed in the current status
 
-    @property
-    def can_stop(self) -> bool:
-        """Check if instance can be stopped"""
-        return self.status == InstanceStatus.RUNNING
+        Args:
+            action: "start", "stop" or "reboot"
 
-    @property
-    def can_reboot(self) -> bool:
-        """Check if instance can be rebooted"""
-        return self.status == InstanceStatus.RUNNING
+        Returns:
+            True if the action can be performed
+        """
+        return action in _ALLOWED_ACTIONS.get(self.status, _NO_ACTIONS)
 
     @property
     def status_display(self) -> str:
         """Return formatted status string with symbol"""
-        return f"{self.status.symbol} {self.status.value}"
+        # Formatted once per status member, not per instance or access
+        return self.status.display
 
     def __str__(self) -> str:
         return f"{self.name} ({self.status.value})"
@@ -121,7 +150,7 @@ class Instance:
         return f"Instance(id='{self.short_id}...', name='{self.name}', status={self.status.value})"
 
 
-@dataclass
+@dataclass(repr=False, **_SLOTS)
 class CodeEngineProject:
     """IBM Cloud Code Engine Project"""
     id: str
@@ -144,7 +173,7 @@ class CodeEngineProject:
         return f"CodeEngineProject(name='{self.name}', id='{self.id[:8]}...', status='{self.status}')"
 
 
-@dataclass
+@dataclass(repr=False, **_SLOTS)
 class CodeEngineApp:
     """IBM Cloud Code Engine Application"""
     id: str
@@ -162,7 +191,7 @@ class CodeEngineApp:
         return f"CodeEngineApp(name='{self.name}', id='{self.id[:8]}...', status='{self.status}')"
 
 
-@dataclass
+@dataclass(repr=False, **_SLOTS)
 class CodeEngineJob:
     """IBM Cloud Code Engine Job"""
     id: str
@@ -180,7 +209,7 @@ class CodeEngineJob:
         return f"CodeEngineJob(name='{self.name}', id='{self.id[:8]}...', status='{self.status}')"
 
 
-@dataclass
+@dataclass(repr=False, **_SLOTS)
 class CodeEngineBuild:
     """IBM Cloud Code Engine Build"""
     id: str
@@ -198,7 +227,7 @@ class CodeEngineBuild:
         return f"CodeEngineBuild(name='{self.name}', id='{self.id[:8]}...', status='{self.status}')"
 
 
-@dataclass
+@dataclass(repr=False, **_SLOTS)
 class CodeEngineSecret:
     """IBM Cloud Code Engine Secret"""
     id: str
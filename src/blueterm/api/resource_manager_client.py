@@ -1,12 +1,61 @@
 """IBM Cloud Resource Manager API Client"""
-from typing import List
-import requests
+import asyncio
+import base64
 import json
-from pathlib import Path
+import logging
+import threading
+import time
+from operator import attrgetter
+from typing import Dict, List, Optional
+
+import requests
 from icecream import ic
 
-from .models import ResourceGroup
+from ..log_writer import log_always
 from .exceptions import AuthenticationError
+from .http import (
+    IAM_TOKEN_HEADERS,
+    IAM_TOKEN_URL,
+    JSON_HEADERS,
+    REQUEST_TIMEOUT,
+    create_session,
+    decode_json,
+)
+from .models import ResourceGroup
+
+logger = logging.getLogger(__name__)
+
+
+def _account_id_from_token(token: str) -> Optional[str]:
+    """
+    Read the account ID from the payload of an IAM access token (a JWT)
+
+    Args:
+        token: IAM access token
+
+    Returns:
+        Account ID, or None if the token cannot be decoded or has none
+    """
+    try:
+        # JWT tokens have 3 parts separated by dots
+        token_parts = token.split('.')
+        if len(token_parts) < 2:
+            return None
+        # Decode the payload (second part), add padding if needed
+        payload = token_parts[1]
+        payload += '=' * (-len(payload) % 4)
+        token_data = json.loads(base64.urlsafe_b64decode(payload))
+        # Try different possible paths for account_id in token
+        account_id = (
+            (token_data.get("account") or {}).get("bss") or
+            token_data.get("account_id") or
+            token_data.get("accountId")
+        )
+        return str(account_id) if account_id else None
+    except Exception as e:
+        log_always(f"Failed to decode token for account_id: {e}")
+        return None
+
 
 class ResourceManagerClient:
     """
@@ -16,52 +65,110 @@ class ResourceManagerClient:
     """
 
     BASE_URL = "https://resource-controller.cloud.ibm.com/v2"
+    TOKEN_REFRESH_BUFFER_SECONDS = 60  # Refresh a minute before the IAM token expires
+    DEFAULT_TOKEN_LIFETIME_SECONDS = 3600  # Used if IAM omits the token expiry
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None):
         """
         Initialize Resource Manager client with IBM Cloud API key
 
         Args:
             api_key: IBM Cloud API key for authentication
+            session: Pooled HTTP session to share with other clients; a new
+                one is created (and owned by this client) if not given
 
         Raises:
             AuthenticationError: If authentication fails
         """
         self.api_key = api_key
-        self._iam_token: str = None
-        self._account_id: str = None
+        self._iam_token: Optional[str] = None
+        self._auth_headers: Dict[str, str] = {}  # Rebuilt when the token is refreshed
+        self._iam_token_expiry: float = 0.0  # time.monotonic() deadline
+        self._token_lock = threading.Lock()
+        self._account_id: Optional[str] = None
+        # Keeps connections to IAM and the Resource Controller alive between calls
+        self._owns_session = session is None
+        self._session = session if session is not None else create_session()
+
+    def close(self) -> None:
+        """Close the pooled HTTP session unless it was passed in"""
+        if self._owns_session:
+            self._session.close()
+
+    def _token_valid(self) -> bool:
+        """Check if the cached IAM token exists and is outside the refresh buffer"""
+        return self._iam_token is not None and time.monotonic() < self._iam_token_expiry
 
     def _get_iam_token(self) -> str:
         """
         Get IAM access token from IBM Cloud
 
+        The token is cached until TOKEN_REFRESH_BUFFER_SECONDS before the
+        expiry reported by IAM, then refreshed.
+
         Returns:
             IAM access token
 
         Raises:
             AuthenticationError: If token retrieval fails
         """
-        if self._iam_token:
-            return self._iam_token
+        token = self._cached_token()
+        if token is not None:
+            return token
+
+        with self._token_lock:
+            # Another caller may have refreshed while we waited for the lock
+            token = self._cached_token()
+            if token is not None:
+                return token
+            return self._request_iam_token()
+
+    def _cached_token(self) -> Optional[str]:
+        """Get the cached IAM token if it is still valid, else None"""
+        return self._iam_token if self._token_valid() else None
+
+    def _request_iam_token(self) -> str:
+        """
+        Exchange the API key for a new IAM access token
+
+        Returns:
+            IAM access token
 
+        Raises:
+            AuthenticationError: If token retrieval fails
+        """
         try:
-            response = requests.post(
-                "https://iam.cloud.ibm.com/identity/token",
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            response = self._session.post(
+                IAM_TOKEN_URL,
+                headers=IAM_TOKEN_HEADERS,
                 data={
                     "grant_type": "urn:ibm:params:oauth:grant-type:apikey",
                     "apikey": self.api_key
-                }
+                },
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            self._iam_token = response.json()["access_token"]
-            return self._iam_token
+            data = decode_json(response)
+            token = str(data["access_token"])
+            self._iam_token = token
+            # Sent with every API request; the session may be shared, so
+            # its default headers are left alone
+            self._auth_headers = {**JSON_HEADERS, "Authorization": f"Bearer {token}"}
+            lifetime = float(data.get("expires_in", self.DEFAULT_TOKEN_LIFETIME_SECONDS))
+            self._iam_token_expiry = time.monotonic() + lifetime - self.TOKEN_REFRESH_BUFFER_SECONDS
+            if not self._account_id:
+                self._account_id = _account_id_from_token(token)
+            return token
         except Exception as e:
-            raise AuthenticationError(f"Failed to get IAM token: {e}")
+            raise AuthenticationError(f"Failed to get IAM token: {e}") from e
 
     def _get_account_id(self) -> str:
         """
-        Get account ID from the API key using IAM API
+        Get account ID for the API key
+
+        The account ID is normally read from the IAM token when it is
+        fetched, so no extra request is needed. The API key details endpoint
+        is only called if the token does not carry it.
 
         Returns:
             Account ID string
@@ -74,44 +181,27 @@ class ResourceManagerClient:
 
         try:
             token = self._get_iam_token()
+            # Fetching the token fills in the account ID when the JWT has one
+            if self._account_id:
+                return self._account_id
             
             # Get API key details to extract account_id using IAM Identity Services API
             # The API key details endpoint returns account_id
-            response = requests.get(
+            response = self._session.get(
                 "https://iam.cloud.ibm.com/v1/apikeys/details",
                 headers={
+                    **JSON_HEADERS,
                     "Authorization": f"Bearer {token}",
-                    "IAM-Apikey": self.api_key,
-                    "Content-Type": "application/json"
-                }
+                    "IAM-Apikey": self.api_key
+                },
+                timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
-            api_key_details = response.json()
+            api_key_details = decode_json(response)
             
             # Extract account_id from the response
             account_id = api_key_details.get("account_id")
             
-            if not account_id:
-                # Fallback: try to decode JWT token to get account info
-                import base64
-                try:
-                    # JWT tokens have 3 parts separated by dots
-                    token_parts = token.split('.')
-                    if len(token_parts) >= 2:
-                        # Decode the payload (second part), add padding if needed
-                        payload = token_parts[1]
-                        payload += '=' * (4 - len(payload) % 4)  # Add padding
-                        payload_decoded = base64.urlsafe_b64decode(payload)
-                        token_data = json.loads(payload_decoded)
-                        # Try different possible paths for account_id in token
-                        account_id = (
-                            token_data.get("account", {}).get("bss") or
-                            token_data.get("account_id") or
-                            token_data.get("accountId")
-                        )
-                except Exception as decode_err:
-                    ic(f"Failed to decode token for account_id: {decode_err}")
-            
             if not account_id:
                 raise AuthenticationError("Could not extract account_id from API key or token")
             
@@ -119,15 +209,32 @@ class ResourceManagerClient:
             ic(f"Retrieved account_id: {account_id}")
             return self._account_id
         except Exception as e:
-            ic(f"Error getting account_id: {e}")
+            log_always(f"Error getting account_id: {e}")
             raise AuthenticationError(f"Failed to get account ID: {e}")
 
+    def _get_credentials(self) -> str:
+        """
+        Make sure a valid IAM token is cached and get the account ID
+
+        Both are fetched in one worker-thread hop. The account ID usually
+        comes from the token itself, so this is normally a single request.
+
+        Returns:
+            Account ID string
+
+        Raises:
+            AuthenticationError: If the token or account ID cannot be fetched
+        """
+        self._get_iam_token()
+        return self._get_account_id()
+
     async def list_resource_groups(self) -> List[ResourceGroup]:
         """
         List all resource groups for the account
         
         Uses the Resource Controller API v2 endpoint to fetch all resource groups
-        accessible to the authenticated account.
+        accessible to the authenticated account. The blocking HTTP calls run
+        in worker threads so the event loop stays responsive.
 
         Returns:
             List of ResourceGroup objects
@@ -136,55 +243,53 @@ class ResourceManagerClient:
             Exception: If resource groups cannot be fetched
         """
         try:
-            token = self._get_iam_token()
-            
-            # Get account_id from API key
-            account_id = self._get_account_id()
-            ic(f"Fetching resource groups from Resource Controller API for account {account_id}")
+            # Only leave the event loop when the token or account ID is missing
+            if self._token_valid() and self._account_id:
+                account_id = self._account_id
+            else:
+                account_id = await asyncio.to_thread(self._get_credentials)
+            logger.debug("Fetching resource groups from Resource Controller API for account %s", account_id)
             
             # The Resource Controller API requires account_id parameter
-            response = requests.get(
+            response = await asyncio.to_thread(
+                self._session.get,
                 f"{self.BASE_URL}/resource_groups",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                    "Accept": "application/json"
-                },
+                headers=self._auth_headers,
                 params={
                     "account_id": account_id
-                }
+                },
+                timeout=REQUEST_TIMEOUT
             )
-            ic(f"Resource groups API response status: {response.status_code}")
+            logger.debug("Resource groups API response status: %s", response.status_code)
             response.raise_for_status()
 
-            json_data = response.json()
-            ic(f"Resource groups API response keys: {json_data.keys() if isinstance(json_data, dict) else 'list'}")
+            json_data = decode_json(response)
             
-            resource_groups = []
             # The API returns {"resources": [...]} format
-            rg_list = json_data.get("resources", [])
-            if not rg_list and isinstance(json_data, list):
+            if isinstance(json_data, list):
                 rg_list = json_data
+            else:
+                rg_list = json_data.get("resources", [])
             
-            ic(f"Found {len(rg_list)} resource groups in response")
-            
-            for rg_data in rg_list:
-                try:
-                    resource_groups.append(ResourceGroup(
-                        id=rg_data["id"],
-                        name=rg_data["name"],
-                        state=rg_data.get("state", "active"),
-                        crn=rg_data.get("crn", "")
-                    ))
-                except KeyError as e:
-                    ic(f"Missing required field in resource group data: {e}", rg_data)
-                    continue
-
-            ic(f"Successfully parsed {len(resource_groups)} resource groups")
-            return sorted(resource_groups, key=lambda rg: rg.name)
+            resource_groups = [
+                ResourceGroup(
+                    id=rg_data["id"],
+                    name=rg_data["name"],
+                    state=rg_data.get("state", "active"),
+                    crn=rg_data.get("crn", "")
+                )
+                for rg_data in rg_list
+                if "id" in rg_data and "name" in rg_data
+            ]
+
+            skipped = len(rg_list) - len(resource_groups)
+            if skipped:
+                logger.warning("Skipped %d resource groups missing an id or name", skipped)
+            logger.debug("Parsed %d of %d resource groups", len(resource_groups), len(rg_list))
+            return sorted(resource_groups, key=attrgetter("name"))
         except requests.exceptions.HTTPError as e:
-            ic(f"HTTP error fetching resource groups: {e}", f"Response: {e.response.text if hasattr(e, 'response') else 'N/A'}")
+            log_always(f"HTTP error fetching resource groups: {e}, response: {e.response.text if hasattr(e, 'response') else 'N/A'}")
             raise Exception(f"Failed to list resource groups: HTTP {e.response.status_code if hasattr(e, 'response') else 'unknown'}")
         except Exception as e:
-            ic(f"Exception in list_resource_groups: {e}")
+            log_always(f"Exception in list_resource_groups: {e}")
             raise Exception(f"Failed to list resource groups: {e}")
@@ -1,9 +1,71 @@
 """Red Hat OpenShift on IBM Cloud (ROKS) API Client (Stub)"""
-from typing import List, Optional
 from datetime import datetime
+from typing import List, Optional
 
-from .models import Region
-from .exceptions import AuthenticationError
+from ._regions import list_service_regions
+from .exceptions import AuthenticationError, InstanceError
+from .models import Instance, InstanceStatus, Region
+
+# ROKS endpoint for each region (same as IKS); ROKS supports all VPC regions
+_ROKS_ENDPOINTS = {
+    "us-south": "https://us-south.containers.cloud.ibm.com",
+    "us-east": "https://us-east.containers.cloud.ibm.com",
+    "eu-gb": "https://eu-gb.containers.cloud.ibm.com",
+    "eu-de": "https://eu-de.containers.cloud.ibm.com",
+    "jp-tok": "https://jp-tok.containers.cloud.ibm.com",
+    "au-syd": "https://au-syd.containers.cloud.ibm.com",
+    "br-sao": "https://br-sao.containers.cloud.ibm.com",
+    "ca-mon": "https://ca-mon.containers.cloud.ibm.com",
+    "ca-tor": "https://ca-tor.containers.cloud.ibm.com",
+    "eu-es": "https://eu-es.containers.cloud.ibm.com",
+    "jp-osa": "https://jp-osa.containers.cloud.ibm.com",
+}
+
+# Known ROKS regions, used when the VPC regions API is unavailable
+_ROKS_FALLBACK_REGIONS = tuple(
+    Region(name=name, endpoint=endpoint, status="available")
+    for name, endpoint in _ROKS_ENDPOINTS.items()
+)
+
+# ROKS cluster state -> InstanceStatus used by the instance table
+_ROKS_STATUS_MAP = {
+    "normal": InstanceStatus.RUNNING,
+    "warning": InstanceStatus.PENDING,
+    "critical": InstanceStatus.FAILED,
+    "deploying": InstanceStatus.STARTING,
+    "deleting": InstanceStatus.STOPPING,
+}
+
+# Creation timestamp reported for stub clusters, fixed at import
+_STUB_CREATED = datetime.now().isoformat()
+
+# Placeholder clusters returned by the stub; region is filled in per call
+_STUB_CLUSTERS = (
+    {
+        "id": "roks-cluster-001",
+        "name": "production-openshift-cluster",
+        "state": "normal",
+        "created_date": _STUB_CREATED,
+        "workers": 6,
+        "worker_pools": 2,
+        "openshift_version": "4.14.8",
+        "kubernetes_version": "1.27.8",
+        "vpc_id": "vpc-prod-001",
+        "vpc_name": "production-vpc",
+    },
+    {
+        "id": "roks-cluster-002",
+        "name": "development-openshift-cluster",
+        "state": "normal",
+        "created_date": _STUB_CREATED,
+        "workers": 3,
+        "worker_pools": 1,
+        "openshift_version": "4.13.25",
+        "kubernetes_version": "1.26.11",
+        "vpc_id": "vpc-dev-001",
+        "vpc_name": "development-vpc",
+    },
+)
 
 
 class ROKSClient:
@@ -33,76 +95,23 @@ class ROKSClient:
         self._current_region: Optional[str] = None
         # TODO: Add real IBM Cloud SDK authentication
 
-    async def list_regions(self) -> List[Region]:
+    async def list_regions(self, force_refresh: bool = False) -> List[Region]:
         """
         List available ROKS regions
         
         ROKS supports the same regions as VPC. We use the VPC API
         to get all available regions, then map them to ROKS endpoints.
+        The VPC region list is cached process-wide (see _regions.py).
+
+        Args:
+            force_refresh: Bypass the cache and fetch from the API
 
         Returns:
             List of Region objects
         """
-        # ROKS supports all VPC regions
-        # Map of region names to ROKS endpoints (same as IKS)
-        roks_endpoints = {
-            "us-south": "https://us-south.containers.cloud.ibm.com",
-            "us-east": "https://us-east.containers.cloud.ibm.com",
-            "eu-gb": "https://eu-gb.containers.cloud.ibm.com",
-            "eu-de": "https://eu-de.containers.cloud.ibm.com",
-            "jp-tok": "https://jp-tok.containers.cloud.ibm.com",
-            "au-syd": "https://au-syd.containers.cloud.ibm.com",
-            "br-sao": "https://br-sao.containers.cloud.ibm.com",
-            "ca-mon": "https://ca-mon.containers.cloud.ibm.com",
-            "ca-tor": "https://ca-tor.containers.cloud.ibm.com",
-            "eu-es": "https://eu-es.containers.cloud.ibm.com",
-            "jp-osa": "https://jp-osa.containers.cloud.ibm.com",
-        }
-        
-        # Try to get regions from VPC API if available, otherwise use known regions
-        try:
-            from ibm_vpc import VpcV1
-            from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
-            from datetime import datetime, timedelta
-            
-            authenticator = IAMAuthenticator(self.api_key)
-            today = datetime.now()
-            version_date = (today - timedelta(days=1)).strftime("%Y-%m-%d")
-            vpc_service = VpcV1(authenticator=authenticator, version=version_date)
-            
-            # Use us-south endpoint to get all regions
-            vpc_service.set_service_url("https://us-south.iaas.cloud.ibm.com/v1")
-            regions_response = vpc_service.list_regions()
-            
-            regions = []
-            for region_data in regions_response.get_result()["regions"]:
-                region_name = region_data["name"]
-                if region_name in roks_endpoints:
-                    regions.append(Region(
-                        name=region_name,
-                        endpoint=roks_endpoints[region_name],
-                        status=region_data.get("status", "available")
-                    ))
-            
-            if regions:
-                return sorted(regions, key=lambda r: r.name)
-        except Exception as e:
-            pass
-        
-        # Fallback to known regions
-        return [
-            Region(name="us-south", endpoint="https://us-south.containers.cloud.ibm.com", status="available"),
-            Region(name="us-east", endpoint="https://us-east.containers.cloud.ibm.com", status="available"),
-            Region(name="eu-gb", endpoint="https://eu-gb.containers.cloud.ibm.com", status="available"),
-            Region(name="eu-de", endpoint="https://eu-de.containers.cloud.ibm.com", status="available"),
-            Region(name="jp-tok", endpoint="https://jp-tok.containers.cloud.ibm.com", status="available"),
-            Region(name="au-syd", endpoint="https://au-syd.containers.cloud.ibm.com", status="available"),
-            Region(name="br-sao", endpoint="https://br-sao.containers.cloud.ibm.com", status="available"),
-            Region(name="ca-mon", endpoint="https://ca-mon.containers.cloud.ibm.com", status="available"),
-            Region(name="ca-tor", endpoint="https://ca-tor.containers.cloud.ibm.com", status="available"),
-            Region(name="eu-es", endpoint="https://eu-es.containers.cloud.ibm.com", status="available"),
-            Region(name="jp-osa", endpoint="https://jp-osa.containers.cloud.ibm.com", status="available"),
-        ]
+        return await list_service_regions(
+            self.api_key, _ROKS_ENDPOINTS, _ROKS_FALLBACK_REGIONS, force_refresh
+        )
 
     def set_region(self, region_name: str) -> None:
         """
@@ -122,33 +131,10 @@ class ROKSClient:
             List of cluster dictionaries (stub data)
         """
         # Stub: Return placeholder data
+        region = self._current_region or "us-south"
         return [
-            {
-                "id": "roks-cluster-001",
-                "name": "production-openshift-cluster",
-                "state": "normal",
-                "created_date": datetime.now().isoformat(),
-                "workers": 6,
-                "worker_pools": 2,
-                "openshift_version": "4.14.8",
-                "kubernetes_version": "1.27.8",
-                "region": self._current_region or "us-south",
-                "vpc_id": "vpc-prod-001",
-                "vpc_name": "production-vpc",
-            },
-            {
-                "id": "roks-cluster-002",
-                "name": "development-openshift-cluster",
-                "state": "normal",
-                "created_date": datetime.now().isoformat(),
-                "workers": 3,
-                "worker_pools": 1,
-                "openshift_version": "4.13.25",
-                "kubernetes_version": "1.26.11",
-                "region": self._current_region or "us-south",
-                "vpc_id": "vpc-dev-001",
-                "vpc_name": "development-vpc",
-            },
+            {**cluster, "region": region}
+            for cluster in _STUB_CLUSTERS
         ]
 
     async def get_cluster(self, cluster_id: str) -> dict:
@@ -166,7 +152,7 @@ class ROKSClient:
             "id": cluster_id,
             "name": f"openshift-{cluster_id}",
             "state": "normal",
-            "created_date": datetime.now().isoformat(),
+            "created_date": _STUB_CREATED,
             "workers": 5,
             "openshift_version": "4.14.8",
             "kubernetes_version": "1.27.8",
@@ -175,19 +161,21 @@ class ROKSClient:
             "ingress_hostname": f"apps.{cluster_id}.containers.cloud.ibm.com",
         }
 
-    async def list_instances(self, region: Optional[str] = None) -> List:
+    async def list_instances(
+        self,
+        region: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> List[Instance]:
         """
         Compatibility method for app - returns clusters as instances
 
         Args:
             region: Optional region to list clusters from
+            force_refresh: Accepted for interface compatibility (stub data is not cached)
 
         Returns:
             List of Instance objects representing ROKS clusters
         """
-        from .models import Instance, InstanceStatus
-        from datetime import datetime
-
         # Get cluster data
         clusters = await self.list_clusters()
 
@@ -195,14 +183,7 @@ class ROKSClient:
         instances = []
         for cluster in clusters:
             # Map cluster state to instance status
-            status_map = {
-                "normal": InstanceStatus.RUNNING,
-                "warning": InstanceStatus.PENDING,
-                "critical": InstanceStatus.FAILED,
-                "deploying": InstanceStatus.STARTING,
-                "deleting": InstanceStatus.STOPPING,
-            }
-            status = status_map.get(cluster.get("state", "normal"), InstanceStatus.RUNNING)
+            status = _ROKS_STATUS_MAP.get(cluster.get("state", "normal"), InstanceStatus.RUNNING)
 
             # Format profile as "X workers, Y pools" for display
             workers_count = cluster.get('workers', 0)
@@ -218,13 +199,32 @@ class ROKSClient:
                 vpc_id=cluster.get("vpc_name", cluster.get("vpc_id", "N/A")),  # VPC name or ID
                 profile=profile_str,  # "X workers, Y pools"
                 primary_ip=None,
-                created_at=cluster.get("created_date", datetime.now().isoformat()),
+                created_at=cluster.get("created_date", _STUB_CREATED),
                 crn=""
             )
             instances.append(instance)
 
         return instances
 
+    async def get_instance(self, instance_id: str, force_refresh: bool = False) -> Instance:
+        """
+        Compatibility method for app - returns one cluster as an instance
+
+        Args:
+            instance_id: Cluster ID
+            force_refresh: Accepted for interface compatibility (stub data is not cached)
+
+        Returns:
+            Instance object representing the ROKS cluster
+
+        Raises:
+            InstanceError: If no cluster has the given ID
+        """
+        for instance in await self.list_instances(self._current_region):
+            if instance.id == instance_id:
+                return instance
+        raise InstanceError(f"ROKS cluster {instance_id} not found")
+
     async def start_instance(self, instance_id: str) -> None:
         """Stub: ROKS clusters don't have start/stop like VMs"""
         pass
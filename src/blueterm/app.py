@@ -1,18 +1,23 @@
 """Main Blueterm Application"""
-from typing import Optional, List
-import json
 import asyncio
+import functools
+import logging
+import threading
+from collections import Counter
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+from icecream import ic
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
-from textual.widgets import Header, Footer
-from textual.worker import Worker, WorkerState
 from textual.theme import Theme
-from icecream import ic
-import logging
+from textual.widgets import Footer, Header
+from textual.worker import WorkerState, get_current_worker
+
+from .api.http import create_session
+from .log_writer import log_always
 
 # Get the package directory for CSS path
 # Handle both installed package and source development
@@ -49,6 +54,60 @@ from .screens.error_screen import ErrorScreen
 from .screens.code_engine_project_detail_screen import CodeEngineProjectDetailScreen
 from .screens.resource_group_selection_screen import ResourceGroupSelectionScreen
 
+# Code Engine app status -> InstanceStatus for the project resources view
+_CE_APP_STATUS_MAP = {
+    "ready": InstanceStatus.RUNNING,
+    "deploying": InstanceStatus.STARTING,
+    "failed": InstanceStatus.FAILED,
+    "stopped": InstanceStatus.STOPPED,
+}
+
+# Code Engine job and build status -> InstanceStatus
+_CE_RUN_STATUS_MAP = {
+    "ready": InstanceStatus.RUNNING,
+    "running": InstanceStatus.RUNNING,
+    "failed": InstanceStatus.FAILED,
+    "stopped": InstanceStatus.STOPPED,
+}
+
+# Quiet period after the last keystroke before the search filter runs
+_SEARCH_DEBOUNCE_SECONDS = 0.15
+
+# Refresh requests (auto-refresh ticks, R) this close together become one load
+_REFRESH_COALESCE_SECONDS = 0.05
+
+# Most API-calling workers allowed to run their requests at once; the rest
+# wait for a slot, so bursts of region/type switching can't pile up calls
+_API_WORKER_LIMIT = 4
+
+# Instance action -> (client method, state the instance must be in)
+_INSTANCE_ACTIONS = {
+    "start": ("start_instance", "stopped"),
+    "stop": ("stop_instance", "running"),
+    "reboot": ("reboot_instance", "running"),
+}
+
+
+def _api_worker(method):
+    """
+    Run a thread worker's body only while holding one of the app's API slots
+
+    Workers cancelled while waiting for a slot return without calling the
+    API. Apply below @work so the worker keeps the method's name.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        # Thread workers each run their own event loop, so a blocking
+        # threading semaphore is used rather than an asyncio one
+        self._api_slots.acquire()
+        try:
+            if get_current_worker().is_cancelled:
+                return None
+            return await method(self, *args, **kwargs)
+        finally:
+            self._api_slots.release()
+    return wrapper
+
 
 class BluetermApp(App):
     """
@@ -129,12 +188,7 @@ class BluetermApp(App):
         Binding("left", "region_previous", show=False),
         Binding("right", "region_next", show=False),
         # Number keys for quick region switching (0, 5-9 when regions focused)
-        Binding("0", "region_number(0)", show=False),
-        Binding("5", "region_number(5)", show=False),
-        Binding("6", "region_number(6)", show=False),
-        Binding("7", "region_number(7)", show=False),
-        Binding("8", "region_number(8)", show=False),
-        Binding("9", "region_number(9)", show=False),
+        *[Binding(str(n), f"region_number({n})", show=False) for n in (0, 5, 6, 7, 8, 9)],
         Binding("t", "cycle_theme", "Theme", show=False),
         Binding("a", "toggle_auto_refresh", "Auto-refresh", show=False),
         # Code Engine navigation
@@ -158,6 +212,7 @@ class BluetermApp(App):
         "monokai",
         "solarized-light",
     ]
+    _THEME_INDEX = {theme: i for i, theme in enumerate(THEMES)}
 
     def __init__(self):
         super().__init__()
@@ -195,12 +250,16 @@ class BluetermApp(App):
                     force=True
                 )
 
-            # Initialize all API clients
-            self.vpc_client = IBMCloudClient(self.config.api_key)
+            # Initialize all API clients. The HTTP clients share one pooled
+            # session, so IAM and other shared hosts reuse keep-alive connections
+            self.http_session = create_session()
+            self.vpc_client = IBMCloudClient(self.config.api_key, session=self.http_session)
             self.iks_client = IKSClient(self.config.api_key)
             self.roks_client = ROKSClient(self.config.api_key)
-            self.code_engine_client = CodeEngineClient(self.config.api_key)
-            self.resource_manager_client = ResourceManagerClient(self.config.api_key)
+            self.code_engine_client = CodeEngineClient(self.config.api_key, session=self.http_session)
+            self.resource_manager_client = ResourceManagerClient(
+                self.config.api_key, session=self.http_session
+            )
 
             # Set current client to VPC by default
             self.client = self.vpc_client
@@ -210,24 +269,32 @@ class BluetermApp(App):
             self.exit(1, str(e))
             return
 
-        # Load user preferences
-        self.preferences = UserPreferences.load()
-
-        # Set theme from preferences
-        if self.preferences.theme in self.THEMES:
-            self.current_theme_index = self.THEMES.index(self.preferences.theme)
-        else:
-            self.current_theme_index = 0
-            self.preferences.theme = self.THEMES[0]
+        # Defaults until on_mount reads the saved preferences from disk
+        self.preferences = UserPreferences()
+        self.current_theme_index = 0
 
         self.regions: List[Region] = []
+        self._regions_by_name: Dict[str, Region] = {}  # Rebuilt in load_regions
         self.current_region: Optional[Region] = None
         self.resource_groups: List[ResourceGroup] = []
         self.current_resource_group: Optional[ResourceGroup] = None
         self.instances: List[Instance] = []
         self.filtered_instances: List[Instance] = []
         self.search_query: str = ""
+        # (instance, casefolded "name\0status") built once per load, and the
+        # matches for the last query so typing narrows incrementally
+        self._search_index: List[Tuple[Instance, str]] = []
+        self._last_query: str = ""
+        self._last_matches: List[Tuple[Instance, str]] = []
+        # Instance count per status value for the current instances
+        self._status_counts: Counter = Counter()
         self._refresh_timer = None  # Auto-refresh timer
+        self._search_debounce_timer = None  # Pending search filter
+        # Coalesced refresh requests (see _request_refresh)
+        self._refresh_pending_timer = None
+        self._refresh_force = False
+        self._refresh_manual = False  # Any request in the batch from the user
+        self._api_slots = threading.BoundedSemaphore(_API_WORKER_LIMIT)
         
         # Code Engine specific state
         self.selected_project: Optional[CodeEngineProject] = None
@@ -281,11 +348,31 @@ class BluetermApp(App):
         """Initialize application on mount"""
         self.title = self.TITLE
 
+        # Widgets are looked up once here; handlers and workers use these
+        # attributes instead of walking the DOM on every call
+        self._info_bar = self.query_one("#info_bar", InfoBar)
+        self._top_nav = self.query_one("#top_navigation", TopNavigation)
+        self._instance_table = self.query_one("#instance_table", InstanceTable)
+        self._detail_panel = self.query_one("#detail_panel", DetailPanel)
+        self._action_bar = self.query_one("#action_bar", ActionBar)
+        self._search_input = self.query_one("#search_input", SearchInput)
+        self._status_bar = self.query_one("#status_bar", StatusBar)
+
+        # Load user preferences here rather than in __init__, so reading the
+        # config file doesn't hold up constructing the app
+        self.preferences = UserPreferences.load()
+
         # Set theme from preferences
+        theme_index = self._THEME_INDEX.get(self.preferences.theme)
+        if theme_index is None:
+            theme_index = 0
+            self.preferences.theme = self.THEMES[0]
+        self.current_theme_index = theme_index
         self.theme = self.preferences.theme
 
-        # Start time update timer (update every second)
-        self.set_interval(1.0, self._update_time_display)
+        # Start time update timer (update every second). The clock shows
+        # seconds; the bound method goes straight to the cached InfoBar
+        self.set_interval(1.0, self._info_bar.update_time)
 
         # Load regions first (needed for UI display)
         self.load_regions()
@@ -297,20 +384,22 @@ class BluetermApp(App):
         if self.preferences.auto_refresh_enabled:
             self._start_auto_refresh()
 
-    def _update_time_display(self) -> None:
-        """Update the time display in info bar"""
-        try:
-            info_bar = self.query_one("#info_bar", InfoBar)
-            info_bar.update_time()
-        except:
-            pass
+    def on_unmount(self) -> None:
+        """Release pooled HTTP connections on shutdown"""
+        if hasattr(self, "code_engine_client"):
+            self.code_engine_client.close()
+        if hasattr(self, "resource_manager_client"):
+            self.resource_manager_client.close()
+        if hasattr(self, "http_session"):
+            self.http_session.close()
 
     @work(thread=True)
+    @_api_worker
     async def load_resource_groups(self) -> None:
         """Load available resource groups from API"""
         try:
             # Access UI directly (Textual workers handle thread safety)
-            status_bar = self.query_one("#status_bar", StatusBar)
+            status_bar = self._status_bar
             status_bar.set_loading(True)
 
             self.resource_groups = await self.resource_manager_client.list_resource_groups()
@@ -327,36 +416,36 @@ class BluetermApp(App):
                 # Update top navigation and InfoBar (must be done in main thread)
                 def update_ui():
                     try:
-                        top_nav = self.query_one("#top_navigation", TopNavigation)
+                        top_nav = self._top_nav
                         ic(f"Setting {len(self.resource_groups)} resource groups on top navigation")
                         top_nav.set_resource_groups(self.resource_groups, self.current_resource_group)
                         ic(f"Resource groups set on top navigation")
                     except Exception as e:
                         import traceback
-                        ic(f"ERROR: Failed to update top navigation with resource groups: {e}")
+                        log_always(f"ERROR: Failed to update top navigation with resource groups: {e}")
                         ic(f"Traceback: {traceback.format_exc()}")
 
                     try:
-                        info_bar = self.query_one("#info_bar", InfoBar)
+                        info_bar = self._info_bar
                         info_bar.set_resource_group(self.current_resource_group)
                     except Exception as e:
-                        ic(f"Warning: Failed to update info bar with resource group: {e}")
+                        log_always(f"Warning: Failed to update info bar with resource group: {e}")
 
                 self.call_from_thread(update_ui)
             else:
                 ic("No resource groups returned from API")
 
             # Update status bar (Textual workers handle thread safety)
-            status_bar = self.query_one("#status_bar", StatusBar)
+            status_bar = self._status_bar
             status_bar.set_loading(False)
 
         except Exception as e:
             # Non-fatal error - resource groups are optional for VPC/IKS/ROKS
-            ic(f"ERROR: Failed to load resource groups: {e}")
+            log_always(f"ERROR: Failed to load resource groups: {e}")
             # Show error in status bar
             def show_error():
                 try:
-                    status_bar = self.query_one("#status_bar", StatusBar)
+                    status_bar = self._status_bar
                     status_bar.set_loading(False)
                     status_bar.set_message(f"Warning: Could not load resource groups: {str(e)[:50]}", "warning")
                 except:
@@ -364,18 +453,29 @@ class BluetermApp(App):
             self.call_from_thread(show_error)
 
     @work(thread=True, exclusive=True)
+    @_api_worker
     async def load_regions(self) -> None:
         """Load available regions from API"""
         try:
-            status_bar = self.query_one("#status_bar", StatusBar)
+            status_bar = self._status_bar
             status_bar.set_loading(True)
 
-            self.regions = await self.client.list_regions()
+            if self.current_resource_type == ResourceType.CODE_ENGINE:
+                # Code Engine listings depend on the resource group, which is
+                # only applied to the client in load_instances
+                self.regions = await self.client.list_regions()
+            else:
+                # The default region's instances don't depend on the region
+                # list, so warm the client's instance cache at the same time
+                self.regions, _ = await asyncio.gather(
+                    self.client.list_regions(),
+                    self._prefetch_instances(self.config.default_region),
+                )
+            self._regions_by_name = {r.name: r for r in self.regions}
             ic(f"Loaded {len(self.regions)} regions from API")
 
             # Set default region
-            default = next(
-                (r for r in self.regions if r.name == self.config.default_region),
+            default = self._regions_by_name.get(self.config.default_region) or (
                 self.regions[0] if self.regions else None
             )
 
@@ -386,7 +486,7 @@ class BluetermApp(App):
                 if self.current_resource_type == ResourceType.CODE_ENGINE:
                     self.code_engine_client.set_region(default.name)
 
-                top_nav = self.query_one("#top_navigation", TopNavigation)
+                top_nav = self._top_nav
                 ic(f"Top navigation found, setting {len(self.regions)} regions")
                 top_nav.set_regions(self.regions, default)
                 ic(f"Set {len(self.regions)} regions on top navigation")
@@ -401,7 +501,7 @@ class BluetermApp(App):
 
                 # Update info bar with region and resource group
                 try:
-                    info_bar = self.query_one("#info_bar", InfoBar)
+                    info_bar = self._info_bar
                     info_bar.set_region(default)
                     info_bar.set_resource_group(self.current_resource_group)
                 except:
@@ -436,14 +536,68 @@ class BluetermApp(App):
                 )
             )
 
+    async def _prefetch_instances(self, region_name: str) -> None:
+        """
+        Warm the current client's instance cache for a region
+
+        Failures are ignored; load_instances reports errors when it runs.
+
+        Args:
+            region_name: Region to list instances in
+        """
+        try:
+            await self.client.list_instances(region_name)
+        except Exception as e:
+            log_always(f"Prefetching instances for {region_name} failed: {e}")
+
+    @work(thread=True, exclusive=True, group="prefetch")
+    @_api_worker
+    async def prefetch_neighbour_regions(self, region_name: str) -> None:
+        """
+        Warm the instance cache for the regions either side of a region
+
+        Only runs for clients that can list a region without switching to
+        it, so it never races load_instances for the current region.
+
+        Args:
+            region_name: Region whose neighbours should be prefetched
+        """
+        prefetch = getattr(self.client, "prefetch_instances", None)
+        if prefetch is None or len(self.regions) < 2:
+            return
+
+        names = [r.name for r in self.regions]
+        try:
+            index = names.index(region_name)
+        except ValueError:
+            return
+
+        # Same wrap-around order as the h/l region keys
+        neighbours = {names[(index + 1) % len(names)], names[index - 1]}
+        neighbours.discard(region_name)
+
+        async def warm(name: str) -> None:
+            try:
+                await prefetch(name)
+            except Exception as e:
+                log_always(f"Prefetching instances for {name} failed: {e}")
+
+        await asyncio.gather(*(warm(name) for name in neighbours))
+
     @work(thread=True, exclusive=True)
-    async def load_instances(self) -> None:
-        """Load instances for current region"""
+    @_api_worker
+    async def load_instances(self, force_refresh: bool = False) -> None:
+        """
+        Load instances for current region
+
+        Args:
+            force_refresh: Bypass the client's response cache
+        """
         if not self.current_region:
             return
 
         try:
-            status_bar = self.query_one("#status_bar", StatusBar)
+            status_bar = self._status_bar
             status_bar.set_loading(True)
 
             # For Code Engine, ensure resource group and region are set
@@ -462,10 +616,21 @@ class BluetermApp(App):
                         ic(f"Setting resource group on Code Engine client: {self.current_resource_group.id}")
                         self.code_engine_client.set_resource_group(self.current_resource_group.id)
 
-            self.instances = await self.client.list_instances(self.current_region.name)
+            worker = get_current_worker()
+            instances = await self.client.list_instances(
+                self.current_region.name, force_refresh=force_refresh
+            )
+            # exclusive=True cancels this worker when the region changes again,
+            # but a thread worker's request still runs to completion; drop
+            # its stale result rather than overwrite the newer region's state
+            if worker.is_cancelled:
+                return
+
+            self.instances = instances
+            self._build_search_index()
             self.apply_search_filter()
 
-            instance_table = self.query_one("#instance_table", InstanceTable)
+            instance_table = self._instance_table
             
             # Set resource type on table to configure columns
             table_resource_type_map = {
@@ -479,7 +644,9 @@ class BluetermApp(App):
             # For Code Engine, fetch counts for each project
             project_counts = None
             if self.current_resource_type == ResourceType.CODE_ENGINE:
-                project_counts = await self._fetch_code_engine_project_counts()
+                project_counts = await self._fetch_code_engine_project_counts(force_refresh)
+                if worker.is_cancelled:
+                    return
                 # Store counts for use in project details modal
                 self.project_counts = project_counts
 
@@ -491,22 +658,14 @@ class BluetermApp(App):
             self._refresh_action_bar()
 
             # Update statistics
-            running = sum(1 for i in self.instances if i.status.value == "running")
-            stopped = sum(1 for i in self.instances if i.status.value == "stopped")
-            total = len(self.instances)
-
-            status_bar.update_stats(
-                total=total,
-                running=running,
-                stopped=stopped
-            )
-
-            # Update top navigation with instance counts
-            top_nav = self.query_one("#top_navigation", TopNavigation)
-            top_nav.update_instance_counts(total, running, stopped)
+            self._status_counts = Counter(inst.status.value for inst in self.instances)
+            self._show_status_counts()
 
             status_bar.set_loading(False)
 
+            # Users usually cycle to an adjacent region next; warm those
+            self.prefetch_neighbour_regions(self.current_region.name)
+
         except Exception as e:
             status_bar.set_loading(False)
             # Use call_from_thread to safely push screen from worker thread
@@ -521,9 +680,29 @@ class BluetermApp(App):
                 )
             )
 
-    async def _fetch_code_engine_project_counts(self) -> dict:
+    def _show_status_counts(self) -> None:
+        """Show the instance counts in _status_counts in the status bar and top navigation"""
+        total = sum(self._status_counts.values())
+        running = self._status_counts["running"]
+        stopped = self._status_counts["stopped"]
+
+        status_bar = self._status_bar
+        status_bar.update_stats(
+            total=total,
+            running=running,
+            stopped=stopped
+        )
+
+        # Update top navigation with instance counts
+        top_nav = self._top_nav
+        top_nav.update_instance_counts(total, running, stopped)
+
+    async def _fetch_code_engine_project_counts(self, force_refresh: bool = False) -> dict:
         """
         Fetch counts of apps, jobs, builds, and secrets for each Code Engine project
+
+        Args:
+            force_refresh: Bypass the Code Engine client's resource cache
         
         Returns:
             Dict mapping project_id to counts: {project_id: {"apps": int, "jobs": int, "builds": int, "secrets": int}}
@@ -534,82 +713,31 @@ class BluetermApp(App):
             return project_counts
         
         try:
-            # Fetch counts for all projects in parallel
-            import asyncio
-            tasks = []
-            for instance in self.instances:
-                tasks.append(self._fetch_single_project_counts(instance.id))
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    ic(f"Error fetching counts for project {self.instances[i].id}: {result}")
-                    project_counts[self.instances[i].id] = {"apps": 0, "jobs": 0, "builds": 0, "secrets": 0}
-                else:
-                    project_counts[self.instances[i].id] = result
-                    
+            # Fetch all projects' resources in one bounded fan-out
+            resources = await self.code_engine_client.list_project_resources(
+                [instance.id for instance in self.instances], force_refresh
+            )
+            for project_id, lists in resources.items():
+                project_counts[project_id] = {kind: len(items) for kind, items in lists.items()}
         except Exception as e:
-            ic(f"Error fetching project counts: {e}")
+            log_always(f"Error fetching project counts: {e}")
         
         return project_counts
 
-    async def _fetch_single_project_counts(self, project_id: str) -> dict:
-        """Fetch counts for a single project"""
-        try:
-            apps, jobs, builds, secrets = await asyncio.gather(
-                self.code_engine_client.list_apps(project_id),
-                self.code_engine_client.list_jobs(project_id),
-                self.code_engine_client.list_builds(project_id),
-                self.code_engine_client.list_secrets(project_id),
-                return_exceptions=True
-            )
-            
-            apps_count = len(apps) if not isinstance(apps, Exception) else 0
-            jobs_count = len(jobs) if not isinstance(jobs, Exception) else 0
-            builds_count = len(builds) if not isinstance(builds, Exception) else 0
-            secrets_count = len(secrets) if not isinstance(secrets, Exception) else 0
-            
-            return {
-                "apps": apps_count,
-                "jobs": jobs_count,
-                "builds": builds_count,
-                "secrets": secrets_count
-            }
-        except Exception as e:
-            ic(f"Error fetching counts for project {project_id}: {e}")
-            return {"apps": 0, "jobs": 0, "builds": 0, "secrets": 0}
-
     @work(thread=True, exclusive=True)
+    @_api_worker
     async def load_project_resources(self, project_id: str) -> None:
         """Load apps, jobs, builds, and secrets for a Code Engine project"""
         try:
-            status_bar = self.query_one("#status_bar", StatusBar)
+            status_bar = self._status_bar
             status_bar.set_loading(True)
 
-            # Load all project resources in parallel
-            apps, jobs, builds, secrets = await asyncio.gather(
-                self.code_engine_client.list_apps(project_id),
-                self.code_engine_client.list_jobs(project_id),
-                self.code_engine_client.list_builds(project_id),
-                self.code_engine_client.list_secrets(project_id),
-                return_exceptions=True
+            # Load all project resources in parallel (failed lists come back empty)
+            resources = await self.code_engine_client.list_project_resources([project_id])
+            apps, jobs, builds, secrets = (
+                resources[project_id][kind] for kind in ("apps", "jobs", "builds", "secrets")
             )
 
-            # Handle exceptions
-            if isinstance(apps, Exception):
-                ic(f"Error loading apps: {apps}")
-                apps = []
-            if isinstance(jobs, Exception):
-                ic(f"Error loading jobs: {jobs}")
-                jobs = []
-            if isinstance(builds, Exception):
-                ic(f"Error loading builds: {builds}")
-                builds = []
-            if isinstance(secrets, Exception):
-                ic(f"Error loading secrets: {secrets}")
-                secrets = []
-
             self.project_apps = apps
             self.project_jobs = jobs
             self.project_builds = builds
@@ -626,113 +754,116 @@ class BluetermApp(App):
             )
 
         except Exception as e:
-            ic(f"Error loading project resources: {e}")
-            status_bar = self.query_one("#status_bar", StatusBar)
+            log_always(f"Error loading project resources: {e}")
+            status_bar = self._status_bar
             status_bar.set_loading(False)
             status_bar.set_message(f"Failed to load project resources: {str(e)[:50]}", "error")
 
     def _update_project_resources_display(self) -> None:
         """Update instance table to show Code Engine project resources"""
-        instance_table = self.query_one("#instance_table", InstanceTable)
+        instance_table = self._instance_table
         
         # Convert Code Engine resources to Instance objects for display
-        resources = []
+        zone = self.current_region.name if self.current_region else "N/A"
+        resources: List[Instance] = []
+        append = resources.append
         
         if self.project_resources_view == "apps":
+            get_status = _CE_APP_STATUS_MAP.get
             for app in self.project_apps:
-                status_map = {
-                    "ready": InstanceStatus.RUNNING,
-                    "deploying": InstanceStatus.STARTING,
-                    "failed": InstanceStatus.FAILED,
-                    "stopped": InstanceStatus.STOPPED,
-                }
-                instance = Instance(
+                append(Instance(
                     id=app.id,
                     name=app.name,
-                    status=status_map.get(app.status, InstanceStatus.PENDING),
-                    zone=self.current_region.name if self.current_region else "N/A",
+                    status=get_status(app.status, InstanceStatus.PENDING),
+                    zone=zone,
                     vpc_name="Application",
                     vpc_id=app.project_id,
                     profile="App",
                     primary_ip=None,
                     created_at=app.created_at,
                     crn=""
-                )
-                resources.append(instance)
+                ))
         elif self.project_resources_view == "jobs":
+            get_status = _CE_RUN_STATUS_MAP.get
             for job in self.project_jobs:
-                status_map = {
-                    "ready": InstanceStatus.RUNNING,
-                    "running": InstanceStatus.RUNNING,
-                    "failed": InstanceStatus.FAILED,
-                    "stopped": InstanceStatus.STOPPED,
-                }
-                instance = Instance(
+                append(Instance(
                     id=job.id,
                     name=job.name,
-                    status=status_map.get(job.status, InstanceStatus.PENDING),
-                    zone=self.current_region.name if self.current_region else "N/A",
+                    status=get_status(job.status, InstanceStatus.PENDING),
+                    zone=zone,
                     vpc_name="Job",
                     vpc_id=job.project_id,
                     profile="Job",
                     primary_ip=None,
                     created_at=job.created_at,
                     crn=""
-                )
-                resources.append(instance)
+                ))
         elif self.project_resources_view == "builds":
+            get_status = _CE_RUN_STATUS_MAP.get
             for build in self.project_builds:
-                status_map = {
-                    "ready": InstanceStatus.RUNNING,
-                    "running": InstanceStatus.RUNNING,
-                    "failed": InstanceStatus.FAILED,
-                    "stopped": InstanceStatus.STOPPED,
-                }
-                instance = Instance(
+                append(Instance(
                     id=build.id,
                     name=build.name,
-                    status=status_map.get(build.status, InstanceStatus.PENDING),
-                    zone=self.current_region.name if self.current_region else "N/A",
+                    status=get_status(build.status, InstanceStatus.PENDING),
+                    zone=zone,
                     vpc_name="Build",
                     vpc_id=build.project_id,
                     profile="Build",
                     primary_ip=None,
                     created_at=build.created_at,
                     crn=""
-                )
-                resources.append(instance)
+                ))
         elif self.project_resources_view == "secrets":
             for secret in self.project_secrets:
                 # Secrets don't have status, so we'll show them all as RUNNING
-                instance = Instance(
+                append(Instance(
                     id=secret.id,
                     name=secret.name,
                     status=InstanceStatus.RUNNING,  # Secrets are always "active"
-                    zone=self.current_region.name if self.current_region else "N/A",
+                    zone=zone,
                     vpc_name="Secret",
                     vpc_id=secret.project_id,
                     profile=secret.format,  # Show secret format as profile
                     primary_ip=None,
                     created_at=secret.created_at,
                     crn=""
-                )
-                resources.append(instance)
+                ))
 
         self.instances = resources
+        self._build_search_index()
         self.filtered_instances = resources
         instance_table.update_instances(resources, None)
 
+    def _build_search_index(self) -> None:
+        """Casefold the searchable fields of the current instances once"""
+        # The NUL separator keeps a query from matching across name and status
+        self._search_index = [
+            (inst, f"{inst.name}\0{inst.status.value}".casefold())
+            for inst in self.instances
+        ]
+        self._last_query = ""
+        self._last_matches = self._search_index
+
     def apply_search_filter(self) -> None:
         """Filter instances based on search query"""
         if not self.search_query:
             self.filtered_instances = self.instances
+            self._last_query = ""
+            self._last_matches = self._search_index
             return
 
-        query = self.search_query.lower()
-        self.filtered_instances = [
-            inst for inst in self.instances
-            if query in inst.name.lower() or query in inst.status.value.lower()
-        ]
+        query = self.search_query.casefold()
+        # Typing another character can only narrow the previous matches, so
+        # only those need rescanning; anything else rescans the full index
+        if query.startswith(self._last_query):
+            candidates = self._last_matches
+        else:
+            candidates = self._search_index
+
+        matches = [entry for entry in candidates if query in entry[1]]
+        self._last_query = query
+        self._last_matches = matches
+        self.filtered_instances = [entry[0] for entry in matches]
 
     def on_top_navigation_region_changed(self, message) -> None:
         """Handle region change event from top navigation"""
@@ -740,7 +871,7 @@ class BluetermApp(App):
 
         # Update InfoBar with new region
         try:
-            info_bar = self.query_one("#info_bar", InfoBar)
+            info_bar = self._info_bar
             info_bar.set_region(message.region)
         except:
             pass
@@ -750,18 +881,54 @@ class BluetermApp(App):
     def on_search_input_search_changed(self, message) -> None:
         """Handle search query change"""
         self.search_query = message.value
-        self.apply_search_filter()
+        if self._search_debounce_timer is not None:
+            self._search_debounce_timer.stop()
+            self._search_debounce_timer = None
 
-        instance_table = self.query_one("#instance_table", InstanceTable)
-        instance_table.update_instances(self.filtered_instances, None)
+        if not self.search_query:
+            # Clearing the search is applied at once
+            self._run_search_filter()
+            return
+
+        # Filter once the user pauses typing rather than on every keystroke
+        self._search_debounce_timer = self.set_timer(
+            _SEARCH_DEBOUNCE_SECONDS, self._run_search_filter
+        )
+
+    def _run_search_filter(self) -> None:
+        """Filter instances with the current query and redraw the table"""
+        self._search_debounce_timer = None
+        self.apply_search_filter()
+        self._show_filtered_instances()
+
+    def _show_filtered_instances(self) -> None:
+        """Redraw the table with filtered_instances unless it already shows them"""
+        shown = self._instance_table.instances
+        filtered = self.filtered_instances
+        # Compare identities, not IDs: a reload replaces every Instance and
+        # the table must be redrawn even if the same IDs match
+        if len(shown) == len(filtered) and all(a is b for a, b in zip(shown, filtered)):
+            return
+        self._instance_table.update_instances(filtered, None)
 
     def on_search_input_search_cancelled(self) -> None:
         """Handle search cancellation"""
+        if self._search_debounce_timer is not None:
+            self._search_debounce_timer.stop()
+            self._search_debounce_timer = None
+
+        # Esc clears the field first, and that empty SearchChanged has
+        # already reset the filter and table
+        if not self.search_query and self.filtered_instances is self.instances:
+            return
+
+        # An empty query matches everything; no need to run the filter
         self.search_query = ""
-        self.apply_search_filter()
+        self.filtered_instances = self.instances
+        self._last_query = ""
+        self._last_matches = self._search_index
 
-        instance_table = self.query_one("#instance_table", InstanceTable)
-        instance_table.update_instances(self.filtered_instances, None)
+        self._show_filtered_instances()
 
     def on_top_navigation_resource_type_changed(self, message) -> None:
         """Handle resource type change event from top navigation"""
@@ -783,7 +950,7 @@ class BluetermApp(App):
             ResourceType.ROKS: "ROKS Clusters",
             ResourceType.CODE_ENGINE: "Code Engine Projects",
         }
-        top_nav = self.query_one("#top_navigation", TopNavigation)
+        top_nav = self._top_nav
         top_nav.set_resource_type_display(resource_type_display_map[message.resource_type])
 
         # Reset Code Engine project selection when switching away
@@ -797,7 +964,7 @@ class BluetermApp(App):
             self.project_counts = {}
 
         # Show notification
-        status_bar = self.query_one("#status_bar", StatusBar)
+        status_bar = self._status_bar
         status_bar.set_message(f"Switched to {message.resource_type.value}", "info")
 
         # Reload regions for new resource type
@@ -807,7 +974,7 @@ class BluetermApp(App):
         """Handle resource group selection request from top navigation"""
         # If resource group is focused (keyboard navigation), directly change it
         if self.focused_section == "resource_group":
-            top_nav = self.query_one("#top_navigation", TopNavigation)
+            top_nav = self._top_nav
             new_rg = top_nav.selected_resource_group
             if new_rg and new_rg != self.current_resource_group:
                 # Update app state
@@ -816,12 +983,12 @@ class BluetermApp(App):
                 self.code_engine_client.set_resource_group(new_rg.id)
                 # Update InfoBar
                 try:
-                    info_bar = self.query_one("#info_bar", InfoBar)
+                    info_bar = self._info_bar
                     info_bar.set_resource_group(new_rg)
                 except:
                     pass
                 # Show notification
-                status_bar = self.query_one("#status_bar", StatusBar)
+                status_bar = self._status_bar
                 status_bar.set_message(f"Resource Group: {new_rg.name}", "info")
                 # Reload instances if viewing Code Engine
                 if self.current_resource_type == ResourceType.CODE_ENGINE:
@@ -841,7 +1008,7 @@ class BluetermApp(App):
     def _open_resource_group_selector(self) -> None:
         """Open resource group selection modal"""
         if not self.resource_groups:
-            status_bar = self.query_one("#status_bar", StatusBar)
+            status_bar = self._status_bar
             status_bar.set_message("No resource groups available", "error")
             return
 
@@ -849,7 +1016,7 @@ class BluetermApp(App):
         def handle_selection(selected_rg: Optional[ResourceGroup]) -> None:
             if selected_rg:
                 # Update top navigation with new resource group
-                top_nav = self.query_one("#top_navigation", TopNavigation)
+                top_nav = self._top_nav
                 top_nav.set_resource_group(selected_rg)
 
                 # Update app state
@@ -860,13 +1027,13 @@ class BluetermApp(App):
 
                 # Update InfoBar with new resource group
                 try:
-                    info_bar = self.query_one("#info_bar", InfoBar)
+                    info_bar = self._info_bar
                     info_bar.set_resource_group(selected_rg)
                 except:
                     pass
 
                 # Show notification
-                status_bar = self.query_one("#status_bar", StatusBar)
+                status_bar = self._status_bar
                 status_bar.set_message(f"Resource Group: {selected_rg.name}", "info")
 
                 # Reload instances if viewing Code Engine
@@ -890,7 +1057,7 @@ class BluetermApp(App):
 
     def action_region_next(self) -> None:
         """Select next region (l or → key) - context aware"""
-        top_nav = self.query_one("#top_navigation", TopNavigation)
+        top_nav = self._top_nav
         if self.focused_section == "resource_group":
             # Navigate resource groups
             top_nav.select_next_resource_group()
@@ -904,7 +1071,7 @@ class BluetermApp(App):
 
     def action_region_previous(self) -> None:
         """Select previous region (h or ← key) - context aware"""
-        top_nav = self.query_one("#top_navigation", TopNavigation)
+        top_nav = self._top_nav
         if self.focused_section == "resource_group":
             # Navigate resource groups
             top_nav.select_previous_resource_group()
@@ -925,7 +1092,7 @@ class BluetermApp(App):
                 self.action_switch_ce_view(view_map[number])
                 return
 
-        top_nav = self.query_one("#top_navigation", TopNavigation)
+        top_nav = self._top_nav
 
         # If regions are focused, use 0 and 5-9 for region selection
         if self.focused_section == "region":
@@ -953,37 +1120,81 @@ class BluetermApp(App):
                 return
 
         # Otherwise, switch resource type via top navigation
-        top_nav = self.query_one("#top_navigation", TopNavigation)
+        top_nav = self._top_nav
         top_nav.select_resource_type_by_key(key)
     
     def action_focus_region(self) -> None:
         """Focus region selector for keyboard navigation (r key)"""
-        top_nav = self.query_one("#top_navigation", TopNavigation)
+        top_nav = self._top_nav
         self.focused_section = "region"
         top_nav.set_region_focused(True)
-        status_bar = self.query_one("#status_bar", StatusBar)
+        status_bar = self._status_bar
         status_bar.set_message("Region selector focused - use ←/→ to navigate, 0-9 to jump", "info")
 
     def action_focus_resource_group(self) -> None:
         """Focus resource group selector for keyboard navigation (g key)"""
         if not self.resource_groups:
-            status_bar = self.query_one("#status_bar", StatusBar)
+            status_bar = self._status_bar
             status_bar.set_message("No resource groups available", "warning")
             return
-        top_nav = self.query_one("#top_navigation", TopNavigation)
+        top_nav = self._top_nav
         self.focused_section = "resource_group"
         top_nav.set_resource_group_focused(True)
-        status_bar = self.query_one("#status_bar", StatusBar)
+        status_bar = self._status_bar
         status_bar.set_message("Resource group selector focused - use ←/→ to navigate", "info")
 
     def action_toggle_sidebar(self) -> None:
         """Toggle sidebar - no longer used, kept for compatibility"""
-        status_bar = self.query_one("#status_bar", StatusBar)
+        status_bar = self._status_bar
         status_bar.set_message("Sidebar removed - use 1-4 keys to switch resource types", "info")
 
     def action_refresh(self) -> None:
         """Refresh current view"""
-        self.load_instances()
+        self._request_refresh(force_refresh=True)
+
+    def _request_refresh(self, force_refresh: bool = False, automatic: bool = False) -> None:
+        """
+        Ask for an instance reload, coalescing requests made close together
+
+        Every request made within _REFRESH_COALESCE_SECONDS of the first
+        becomes a single load_instances call, forced if any of them was.
+
+        Args:
+            force_refresh: Bypass the client's response cache
+            automatic: Request comes from the auto-refresh timer and may be
+                dropped if a load is already in flight
+        """
+        self._refresh_force = self._refresh_force or force_refresh
+        self._refresh_manual = self._refresh_manual or not automatic
+        if self._refresh_pending_timer is None:
+            self._refresh_pending_timer = self.set_timer(
+                _REFRESH_COALESCE_SECONDS, self._flush_refresh
+            )
+
+    def _flush_refresh(self) -> None:
+        """Start the reload collected by _request_refresh"""
+        force_refresh = self._refresh_force
+        manual = self._refresh_manual
+        self._refresh_force = False
+        self._refresh_manual = False
+        self._refresh_pending_timer = None
+
+        # load_instances is exclusive, so starting another would cancel the
+        # running one and waste its round trip. Only the user asking for a
+        # refresh is worth that; an auto-refresh can use the result in flight
+        # (rechecked here, as a load may have started since the tick)
+        if not manual and self._instances_loading():
+            ic("Refresh skipped: instances still loading")
+            return
+        self.load_instances(force_refresh=force_refresh)
+
+    def _instances_loading(self) -> bool:
+        """Check whether a load_instances worker is pending or running"""
+        return any(
+            worker.name == "load_instances"
+            and worker.state in (WorkerState.PENDING, WorkerState.RUNNING)
+            for worker in self.workers
+        )
 
     def action_cycle_theme(self) -> None:
         """Cycle through available color themes"""
@@ -995,7 +1206,7 @@ class BluetermApp(App):
         self.preferences.update_theme(new_theme)
 
         # Show notification of theme change
-        status_bar = self.query_one("#status_bar", StatusBar)
+        status_bar = self._status_bar
         status_bar.set_message(f"Theme: {new_theme}", "info")
 
     def _start_auto_refresh(self) -> None:
@@ -1005,10 +1216,19 @@ class BluetermApp(App):
 
         self._refresh_timer = self.set_interval(
             self.config.refresh_interval,
-            self.load_instances,
+            self._auto_refresh_tick,
             name="auto_refresh"
         )
 
+    def _auto_refresh_tick(self) -> None:
+        """Reload instances from the API unless a load is already in flight"""
+        if self._instances_loading():
+            ic("Auto-refresh skipped: instances still loading")
+            return
+        # Bypass the client caches: their TTLs can be longer than a short
+        # refresh_interval, which would turn every tick into a cache hit
+        self._request_refresh(force_refresh=True, automatic=True)
+
     def _stop_auto_refresh(self) -> None:
         """Stop auto-refresh timer"""
         if self._refresh_timer is not None:
@@ -1026,17 +1246,17 @@ class BluetermApp(App):
             self._stop_auto_refresh()
             message = "Auto-refresh disabled"
 
-        status_bar = self.query_one("#status_bar", StatusBar)
+        status_bar = self._status_bar
         status_bar.set_message(message, "info")
 
     def action_search(self) -> None:
         """Focus search input"""
-        search_input = self.query_one("#search_input", SearchInput)
+        search_input = self._search_input
         search_input.focus_search()
 
     def action_show_details(self) -> None:
         """Show details for selected instance or Code Engine project in modal window"""
-        instance_table = self.query_one("#instance_table", InstanceTable)
+        instance_table = self._instance_table
         selected = instance_table.get_selected_instance()
 
         if not selected:
@@ -1075,7 +1295,7 @@ class BluetermApp(App):
         self.push_screen(DetailScreen(selected))
 
         # Debug feedback
-        status_bar = self.query_one("#status_bar", StatusBar)
+        status_bar = self._status_bar
         status_bar.set_message(f"Showing details for {selected.name}", "info")
 
     def _refresh_action_bar(self) -> None:
@@ -1089,8 +1309,8 @@ class BluetermApp(App):
         Keeping the logic here avoids duplication and makes it easy to call
         from both code paths.
         """
-        action_bar = self.query_one("#action_bar", ActionBar)
-        instance_table = self.query_one("#instance_table", InstanceTable)
+        action_bar = self._action_bar
+        instance_table = self._instance_table
 
         selected = instance_table.get_selected_instance()
         if selected is None:
@@ -1131,13 +1351,13 @@ class BluetermApp(App):
         If the panel is already showing the same instance it toggles closed.
         If it's showing a different instance (or was closed), it updates and opens.
         """
-        instance_table = self.query_one("#instance_table", InstanceTable)
+        instance_table = self._instance_table
         selected = instance_table.get_selected_instance()
 
         if not selected:
             return
 
-        detail_panel = self.query_one("#detail_panel", DetailPanel)
+        detail_panel = self._detail_panel
 
         if detail_panel.has_class("visible"):
             # Toggle: close if same instance, update if different
@@ -1149,12 +1369,12 @@ class BluetermApp(App):
         # Show (or update) the split panel
         detail_panel.show_instance(selected)
 
-        status_bar = self.query_one("#status_bar", StatusBar)
+        status_bar = self._status_bar
         status_bar.set_message(f"Split view: {selected.name}  (Esc or x to close)", "info")
 
     def action_select_project(self) -> None:
         """Select Code Engine project and load its resources (Enter key)"""
-        instance_table = self.query_one("#instance_table", InstanceTable)
+        instance_table = self._instance_table
         selected = instance_table.get_selected_instance()
 
         if not selected:
@@ -1167,7 +1387,7 @@ class BluetermApp(App):
 
             # Load project resources directly (skip details modal)
             self.load_project_resources(selected.id)
-            status_bar = self.query_one("#status_bar", StatusBar)
+            status_bar = self._status_bar
             status_bar.set_message(f"Loading resources for project '{selected.name}'...", "info")
 
     def on_code_engine_project_detail_screen_view_resources(
@@ -1179,7 +1399,7 @@ class BluetermApp(App):
             if instance.id == message.project_id:
                 self.selected_project = instance
                 self.load_project_resources(message.project_id)
-                status_bar = self.query_one("#status_bar", StatusBar)
+                status_bar = self._status_bar
                 status_bar.set_message(f"Loading resources for project '{instance.name}'...", "info")
                 break
 
@@ -1187,10 +1407,10 @@ class BluetermApp(App):
         """Go back to Code Engine project list or unfocus sections (Esc key)"""
         # If a section is focused, unfocus it
         if self.focused_section:
-            top_nav = self.query_one("#top_navigation", TopNavigation)
+            top_nav = self._top_nav
             top_nav.clear_focus()
             self.focused_section = None
-            status_bar = self.query_one("#status_bar", StatusBar)
+            status_bar = self._status_bar
             status_bar.set_message("Navigation unfocused", "info")
             return
 
@@ -1209,7 +1429,7 @@ class BluetermApp(App):
         # Reload project list
         self.load_instances()
 
-        status_bar = self.query_one("#status_bar", StatusBar)
+        status_bar = self._status_bar
         status_bar.set_message("Returned to project list", "info")
 
     def action_switch_ce_view(self, view: str) -> None:
@@ -1236,7 +1456,7 @@ class BluetermApp(App):
             "secrets": len(self.project_secrets),
         }
 
-        status_bar = self.query_one("#status_bar", StatusBar)
+        status_bar = self._status_bar
         status_bar.set_message(
             f"Viewing {view}: {counts[view]} items (Press 1:Apps 2:Jobs 3:Builds 4:Secrets)",
             "info"
@@ -1256,29 +1476,18 @@ class BluetermApp(App):
 
     def _instance_action(self, action: str, action_label: str) -> None:
         """Execute an action on the selected instance"""
-        instance_table = self.query_one("#instance_table", InstanceTable)
+        instance_table = self._instance_table
         selected = instance_table.get_selected_instance()
 
         if not selected:
             return
 
         # Check if action is valid for instance state
-        if action == "start" and not selected.can_start:
-            self.push_screen(ErrorScreen(
-                f"Cannot start instance in {selected.status.value} state",
-                suggestion="Instance must be stopped to start"
-            ))
-            return
-        elif action == "stop" and not selected.can_stop:
-            self.push_screen(ErrorScreen(
-                f"Cannot stop instance in {selected.status.value} state",
-                suggestion="Instance must be running to stop"
-            ))
-            return
-        elif action == "reboot" and not selected.can_reboot:
+        if not selected.can(action):
+            required_state = _INSTANCE_ACTIONS[action][1]
             self.push_screen(ErrorScreen(
-                f"Cannot reboot instance in {selected.status.value} state",
-                suggestion="Instance must be running to reboot"
+                f"Cannot {action} instance in {selected.status.value} state",
+                suggestion=f"Instance must be {required_state} to {action}"
             ))
             return
 
@@ -1296,6 +1505,7 @@ class BluetermApp(App):
         )
 
     @work(thread=True)
+    @_api_worker
     async def _execute_instance_action(
         self,
         instance_id: str,
@@ -1303,21 +1513,20 @@ class BluetermApp(App):
         action_label: str
     ) -> None:
         """Execute instance action via API"""
+        # get_instance queries the client's current region, so the follow-up
+        # refresh is only valid while the user stays in this one
+        region = self.current_region
         try:
-            status_bar = self.query_one("#status_bar", StatusBar)
+            status_bar = self._status_bar
             status_bar.set_message(f"Executing {action}...", "info")
 
-            if action == "start":
-                await self.client.start_instance(instance_id)
-            elif action == "stop":
-                await self.client.stop_instance(instance_id)
-            elif action == "reboot":
-                await self.client.reboot_instance(instance_id)
+            method_name = _INSTANCE_ACTIONS[action][0]
+            await getattr(self.client, method_name)(instance_id)
 
             status_bar.set_message(f"Instance {action} initiated successfully", "success")
 
-            # Refresh after 2 seconds to show updated state
-            self.set_timer(2.0, self.load_instances)
+            # Refresh just this instance after 2 seconds to show its new state
+            self.set_timer(2.0, lambda: self._refresh_instance(instance_id, region))
 
         except Exception as e:
             # Use call_from_thread to safely push screen from worker thread
@@ -1332,6 +1541,52 @@ class BluetermApp(App):
                 )
             )
 
+    @work(thread=True, group="refresh_instance")
+    @_api_worker
+    async def _refresh_instance(self, instance_id: str, region: Optional[Region]) -> None:
+        """
+        Re-fetch one instance and patch it into the current lists and table
+
+        Skipped if the region changed since the action, and falls back to a
+        full reload if the instance can't be fetched.
+
+        Args:
+            instance_id: Instance UUID
+            region: Region that was selected when the action was run
+        """
+        if self.current_region != region:
+            ic(f"Region changed since the action; not refreshing instance {instance_id}")
+            return
+
+        try:
+            updated = await self.client.get_instance(instance_id, force_refresh=True)
+        except Exception as e:
+            log_always(f"Refreshing instance {instance_id} failed, reloading all: {e}")
+            self.load_instances()
+            return
+
+        old = next((inst for inst in self.instances if inst.id == instance_id), None)
+        if old is None:
+            # Region or resource type changed since the action
+            return
+
+        self.instances = [updated if inst.id == instance_id else inst for inst in self.instances]
+        self._status_counts[old.status.value] -= 1
+        self._status_counts[updated.status.value] += 1
+        self._show_status_counts()
+
+        shown_ids = [inst.id for inst in self.filtered_instances]
+        self._build_search_index()
+        self.apply_search_filter()
+
+        instance_table = self._instance_table
+        if [inst.id for inst in self.filtered_instances] == shown_ids:
+            instance_table.update_row(updated)
+        else:
+            # The new status moved it in or out of the search results
+            instance_table.update_instances(self.filtered_instances)
+        self._refresh_action_bar()
+
     def action_help(self) -> None:
         """Show help screen"""
         help_text = """
@@ -0,0 +1,219 @@
+"""Buffered background log writer used as the icecream output sink"""
+import atexit
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO, Tuple
+
+# Sentinel placed on the queue to tell the worker thread to shut down
+_STOP = object()
+
+
+class BufferedLogWriter:
+    """
+    Append log lines to one or more files from a single background thread.
+
+    Callers only enqueue the formatted line, so logging never blocks the
+    Textual event loop on file I/O. The worker thread creates the log
+    directory and opens the files on the first write, writes through large
+    buffered file handles and flushes every FLUSH_EVERY lines or every
+    FLUSH_INTERVAL seconds, whichever comes first.
+
+    A line identical to one written within the last DEDUP_WINDOW seconds is
+    held back, so a failing call retried in a loop (e.g. during an IAM outage)
+    cannot flood the log. Nothing is lost silently: once the window has passed
+    (or on close) a "suppressed N repeats" line records how many were dropped.
+    """
+
+    BUFFER_SIZE = 64 * 1024
+    FLUSH_EVERY = 100
+    FLUSH_INTERVAL = 0.5  # seconds
+    DEDUP_WINDOW = 5.0  # seconds
+    DEDUP_MAX_ENTRIES = 1024  # Prune expired entries beyond this many
+
+    def __init__(self, *paths: Path):
+        """
+        Start the writer thread
+
+        Args:
+            paths: Log files to append every line to
+        """
+        self._paths = paths
+        self._handles: Optional[List[TextIO]] = None
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        # line -> (time it was last written, repeats suppressed since then)
+        self._last_seen: Dict[str, Tuple[float, int]] = {}
+        self._dedup_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="blueterm-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        """Enqueue a line for writing (never blocks on file I/O)"""
+        if self._closed:
+            return
+        with self._dedup_lock:
+            for out in self._dedup(line):
+                self._queue.put_nowait(out)
+
+    def _dedup(self, line: str) -> List[str]:
+        """
+        Apply the DEDUP_WINDOW to a line
+
+        Args:
+            line: Line about to be written
+
+        Returns:
+            Lines to enqueue: empty if the line repeats within the window,
+            otherwise the line preceded by any pending repeat summaries
+        """
+        now = time.monotonic()
+        out: List[str] = []
+        entry = self._last_seen.get(line)
+        if entry is not None:
+            written_at, repeats = entry
+            if now - written_at < self.DEDUP_WINDOW:
+                self._last_seen[line] = (written_at, repeats + 1)
+                return out
+            if repeats:
+                out.append(_repeat_summary(line, repeats))
+
+        if len(self._last_seen) >= self.DEDUP_MAX_ENTRIES:
+            cutoff = now - self.DEDUP_WINDOW
+            kept: Dict[str, Tuple[float, int]] = {}
+            for seen, (written_at, repeats) in self._last_seen.items():
+                if written_at >= cutoff:
+                    kept[seen] = (written_at, repeats)
+                elif repeats:
+                    out.append(_repeat_summary(seen, repeats))
+            self._last_seen = kept
+
+        self._last_seen[line] = (now, 0)
+        out.append(line)
+        return out
+
+    def close(self) -> None:
+        """Flush any buffered lines and close the log files"""
+        if self._closed:
+            return
+        self._closed = True
+        with self._dedup_lock:
+            for line, (_, repeats) in self._last_seen.items():
+                if repeats:
+                    self._queue.put_nowait(_repeat_summary(line, repeats))
+            self._last_seen.clear()
+        self._queue.put_nowait(_STOP)
+        self._thread.join(timeout=2.0)
+
+    def _run(self) -> None:
+        """Drain the queue, writing lines and flushing periodically"""
+        pending = 0
+        last_flush = time.monotonic()
+
+        while True:
+            try:
+                item = self._queue.get(timeout=self.FLUSH_INTERVAL)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                break
+
+            if item is not None:
+                self._write_line(item)
+                pending += 1
+
+            now = time.monotonic()
+            if pending and (pending >= self.FLUSH_EVERY or now - last_flush >= self.FLUSH_INTERVAL):
+                self._flush()
+                pending = 0
+                last_flush = now
+
+        # Drain anything enqueued before close() and release the files
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                self._write_line(item)
+        self._flush()
+        for handle in self._handles or ():
+            handle.close()
+
+    def _open(self) -> List[TextIO]:
+        """Create the log directories and open the log files"""
+        handles: List[TextIO] = []
+        for path in self._paths:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                handles.append(open(path, "a", encoding="utf-8", buffering=self.BUFFER_SIZE))
+            except Exception as e:
+                # Only print errors to stderr if we can't write logs
+                print(f"Warning: Failed to open log file {path}: {e}", file=sys.stderr)
+        return handles
+
+    def _write_line(self, line: str) -> None:
+        """Write a single line to every log file"""
+        if self._handles is None:
+            self._handles = self._open()
+        for handle in self._handles:
+            try:
+                handle.write(line + "\n")
+            except Exception as e:
+                # Only print errors to stderr if we can't write logs
+                print(f"Warning: Failed to write to log file: {e}", file=sys.stderr)
+
+    def _flush(self) -> None:
+        """Flush every log file"""
+        for handle in self._handles or ():
+            try:
+                handle.flush()
+            except Exception:
+                pass
+
+
+def _repeat_summary(line: str, repeats: int) -> str:
+    """Format the line recording how many repeats of a line were dropped"""
+    return f"(suppressed {repeats} repeats of: {line})"
+
+
+# Process-wide writer, created by start_log_writer()
+_log_writer: Optional[BufferedLogWriter] = None
+
+
+def start_log_writer(*paths: Path) -> BufferedLogWriter:
+    """
+    Create the process-wide log writer and flush it at interpreter exit
+
+    Args:
+        paths: Log files to append every line to
+
+    Returns:
+        The BufferedLogWriter instance
+    """
+    global _log_writer
+    if _log_writer is not None:
+        _log_writer.close()
+    _log_writer = BufferedLogWriter(*paths)
+    atexit.register(_log_writer.close)
+    return _log_writer
+
+
+def log_always(message: str) -> None:
+    """
+    Write a message to the log files regardless of whether ic() is enabled
+
+    Used for errors and warnings (failed API calls, fallbacks to cached or
+    known data, startup failures) that must reach the log even when icecream
+    is disabled outside debug mode; ic() is kept for debug-only tracing.
+
+    Args:
+        message: Message to log
+    """
+    if _log_writer is not None:
+        _log_writer.write(message)
@@ -79,7 +79,7 @@ class DetailScreen(ModalScreen[None]):
 
         # Status with color
         status_text = Text(
-            f"{self.instance.status.symbol} {self.instance.status.value}",
+            self.instance.status_display,
             style=self.instance.status.color
         )
         table.add_row("Status", status_text)
@@ -102,9 +102,9 @@ class DetailScreen(ModalScreen[None]):
         # Action availability
         table.add_section()
         table.add_row("", Text("Available Actions", style="yellow bold"))
-        table.add_row("Can Start", "✓" if self.instance.can_start else "✗")
-        table.add_row("Can Stop", "✓" if self.instance.can_stop else "✗")
-        table.add_row("Can Reboot", "✓" if self.instance.can_reboot else "✗")
+        table.add_row("Can Start", "✓" if self.instance.can("start") else "✗")
+        table.add_row("Can Stop", "✓" if self.instance.can("stop") else "✗")
+        table.add_row("Can Reboot", "✓" if self.instance.can("reboot") else "✗")
 
         return table
 
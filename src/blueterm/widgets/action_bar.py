@@ -27,9 +27,9 @@ def _vpc_actions(instance: Instance) -> List[Action]:
     """
     return [
         # (key, label, is_available)
-        ("s", "Start",    instance.can_start),
-        ("S", "Stop",     instance.can_stop),
-        ("b", "Reboot",   instance.can_reboot),
+        ("s", "Start",    instance.can("start")),
+        ("S", "Stop",     instance.can("stop")),
+        ("b", "Reboot",   instance.can("reboot")),
         ("d", "Details",  True),
         ("D", "Split",    True),
     ]
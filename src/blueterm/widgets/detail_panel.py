@@ -173,7 +173,7 @@ class DetailPanel(Widget):
 
         # ---- Status (coloured) ----
         status_text = Text(
-            f"{instance.status.symbol} {instance.status.value}",
+            instance.status_display,
             style=instance.status.color,
         )
         table.add_row("Status", status_text)
@@ -196,8 +196,8 @@ class DetailPanel(Widget):
         # ---- Available actions ----
         table.add_section()
         table.add_row("", Text("Actions", style="yellow bold"))
-        table.add_row("Start",  "✓" if instance.can_start  else "✗")
-        table.add_row("Stop",   "✓" if instance.can_stop   else "✗")
-        table.add_row("Reboot", "✓" if instance.can_reboot else "✗")
+        table.add_row("Start",  "✓" if instance.can("start")  else "✗")
+        table.add_row("Stop",   "✓" if instance.can("stop")   else "✗")
+        table.add_row("Reboot", "✓" if instance.can("reboot") else "✗")
 
         return table
@@ -153,7 +153,7 @@ class InstanceTable(DataTable):
             else:
                 # For VPC, show standard instance columns
                 status_text = Text(
-                    f"{instance.status.symbol} {instance.status.value}",
+                    instance.status_display,
                     style=instance.status.color
                 )
 
@@ -167,6 +167,33 @@ class InstanceTable(DataTable):
                     key=instance.id
                 )
 
+    def update_row(self, instance: Instance) -> None:
+        """
+        Replace a displayed instance and repaint only its row
+
+        Keeps the cursor where it is, unlike update_instances.
+
+        Args:
+            instance: Updated instance; matched to its row by ID
+        """
+        for index, current in enumerate(self.instances):
+            if current.id == instance.id:
+                break
+        else:
+            return
+
+        self.instances = self.instances[:index] + [instance] + self.instances[index + 1:]
+        self.update_cell(instance.id, "name", instance.name)
+        if self.resource_type == ResourceType.VPC:
+            self.update_cell(
+                instance.id, "status",
+                Text(instance.status_display, style=instance.status.color)
+            )
+            self.update_cell(instance.id, "zone", instance.zone)
+            self.update_cell(instance.id, "vpc", instance.vpc_name)
+            self.update_cell(instance.id, "profile", instance.profile)
+            self.update_cell(instance.id, "ip", instance.primary_ip or "N/A")
+
     def get_selected_instance(self) -> Optional[Instance]:
         """
         Get the currently selected instance
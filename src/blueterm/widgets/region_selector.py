@@ -1,16 +1,18 @@
 """Region selector TAWS-style layout widget"""
 from typing import List, Optional
 
+from icecream import ic
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
 from textual.reactive import reactive
 from textual.widget import Widget
-from textual.widgets import Static, Label, Button
-from rich.text import Text
-from icecream import ic
+from textual.widgets import Button, Label, Static
 
 from ..api.models import Region, ResourceGroup
+from ..log_writer import log_always
+
 
 class RegionSelector(Widget):
     """
@@ -121,7 +123,7 @@ class RegionSelector(Widget):
             ic(f"Updated instance counts: {count_text}")
         except Exception as e:
             import traceback
-            ic(f"Error updating instance counts: {e}")
+            log_always(f"Error updating instance counts: {e}")
             ic(f"Traceback: {traceback.format_exc()}")
 
         # Update resource type display
@@ -130,7 +132,7 @@ class RegionSelector(Widget):
             resource_value_label.update(Text(self.resource_type_display, style="bold white"))
             ic(f"Updated resource type: {self.resource_type_display}")
         except Exception as e:
-            ic(f"Error updating resource type: {e}")
+            log_always(f"Error updating resource type: {e}")
 
         # Update regions section label (show focus indicator and keyboard shortcut)
         try:
@@ -154,7 +156,7 @@ class RegionSelector(Widget):
                 regions_label.update(label_text)
             ic(f"Updated regions label, focused={self._region_focused}")
         except Exception as e:
-            ic(f"Error updating regions label: {e}")
+            log_always(f"Error updating regions label: {e}")
 
         # Update regions list - horizontal spanning layout
         try:
@@ -187,7 +189,7 @@ class RegionSelector(Widget):
                 ic(f"Regions list widget visible: {regions_list.display}, mounted: {regions_list.is_mounted}")
         except Exception as e:
             import traceback
-            ic(f"Error updating regions list: {e}")
+            log_always(f"Error updating regions list: {e}")
             ic(f"Traceback: {traceback.format_exc()}")
 
         # Update resource group section label (show focus indicator and keyboard shortcut)
@@ -212,7 +214,7 @@ class RegionSelector(Widget):
                 rg_section_label.update(label_text)
             ic(f"Updated resource group label, focused={self._resource_group_focused}")
         except Exception as e:
-            ic(f"Error updating resource group label: {e}")
+            log_always(f"Error updating resource group label: {e}")
 
         # Update resource group list - vertical list showing all groups
         try:
@@ -244,7 +246,7 @@ class RegionSelector(Widget):
                 ic(f"Resource group list widget visible: {rg_list.display}, mounted: {rg_list.is_mounted}")
         except Exception as e:
             import traceback
-            ic(f"Error updating resource group list: {e}")
+            log_always(f"Error updating resource group list: {e}")
             ic(f"Traceback: {traceback.format_exc()}")
 
     def select_by_number(self, number: int) -> None:
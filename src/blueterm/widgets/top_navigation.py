@@ -1,16 +1,17 @@
 """Top navigation widget with 3-column layout: Resource Type | Regions | Resource Group"""
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from icecream import ic
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
 from textual.reactive import reactive
 from textual.widget import Widget
-from textual.widgets import Static, Label
-from rich.text import Text
-from icecream import ic
+from textual.widgets import Label, Static
 
 from ..api.models import Region, ResourceGroup
+from ..log_writer import log_always
 from .resource_type_selector import ResourceType
 
 
@@ -59,6 +60,7 @@ class TopNavigation(Widget):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.regions: List[Region] = []
+        self._region_positions: Dict[str, int] = {}  # Region name -> index in regions
         self.resource_groups: List[ResourceGroup] = []
         self._region_index: int = 0
         self._resource_group_index: int = 0
@@ -143,7 +145,7 @@ class TopNavigation(Widget):
 
             display.update(text)
         except Exception as e:
-            ic(f"Error updating resource type display: {e}")
+            log_always(f"Error updating resource type display: {e}")
 
     def _update_region_display(self) -> None:
         """Update the region selector column (2 rows)"""
@@ -208,7 +210,7 @@ class TopNavigation(Widget):
             row2.update(text2)
 
         except Exception as e:
-            ic(f"Error updating region display: {e}")
+            log_always(f"Error updating region display: {e}")
 
     def _update_resource_group_display(self) -> None:
         """Update the resource group selector column"""
@@ -251,18 +253,17 @@ class TopNavigation(Widget):
             rg_list.update(text)
 
         except Exception as e:
-            ic(f"Error updating resource group display: {e}")
+            log_always(f"Error updating resource group display: {e}")
 
     # --- Region methods ---
 
     def set_regions(self, regions: List[Region], selected: Optional[Region] = None) -> None:
         """Set available regions"""
         self.regions = regions
+        self._region_positions = {r.name: i for i, r in enumerate(regions)}
         if selected:
             self.selected_region = selected
-            self._region_index = next(
-                (i for i, r in enumerate(regions) if r.name == selected.name), 0
-            )
+            self._region_index = self._region_positions.get(selected.name, 0)
         elif regions:
             self.selected_region = regions[0]
             self._region_index = 0
@@ -0,0 +1,100 @@
+"""Tests for TTLCache"""
+import pytest
+
+from blueterm.api.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for expiry tests"""
+    now = [1000.0]
+    monkeypatch.setattr("blueterm.api.cache.time.monotonic", lambda: now[0])
+    return now
+
+
+class TestGet:
+    def test_returns_value_before_expiry(self, clock):
+        cache = TTLCache()
+        cache.set("regions", ["us-south"], ttl=10)
+        clock[0] += 9.9
+        assert cache.get("regions") == ["us-south"]
+
+    def test_returns_none_after_expiry(self, clock):
+        cache = TTLCache()
+        cache.set("regions", ["us-south"], ttl=10)
+        clock[0] += 10
+        assert cache.get("regions") is None
+
+    def test_missing_key(self):
+        assert TTLCache().get("missing") is None
+
+    def test_set_replaces_value_and_expiry(self, clock):
+        cache = TTLCache()
+        cache.set("key", "old", ttl=1)
+        clock[0] += 0.5
+        cache.set("key", "new", ttl=10)
+        clock[0] += 5
+        assert cache.get("key") == "new"
+
+
+class TestGetStale:
+    def test_returns_expired_value(self, clock):
+        cache = TTLCache()
+        cache.set("instances", ["inst-1"], ttl=1)
+        clock[0] += 60
+        assert cache.get("instances") is None
+        assert cache.get_stale("instances") == ["inst-1"]
+
+    def test_missing_key(self):
+        assert TTLCache().get_stale("missing") is None
+
+
+class TestEviction:
+    def test_evicts_least_recently_set(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.set("c", 3, ttl=60)
+        assert cache.get_stale("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_get_marks_entry_recently_used(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+        assert cache.get("a") == 1
+        assert cache.get_stale("b") is None
+
+
+class TestInvalidation:
+    def test_delete_drops_one_entry(self):
+        cache = TTLCache()
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.delete("a")
+        cache.delete("missing")
+        assert cache.get_stale("a") is None
+        assert cache.get("b") == 2
+
+    def test_invalidate_method_drops_matching_tuple_keys(self):
+        cache = TTLCache()
+        cache.set(("list_instances", "us-south"), 1, ttl=60)
+        cache.set(("list_instances", "eu-de"), 2, ttl=60)
+        cache.set(("list_regions",), 3, ttl=60)
+        cache.set("list_instances", 4, ttl=60)
+        cache.invalidate("list_instances")
+        assert cache.get_stale(("list_instances", "us-south")) is None
+        assert cache.get_stale(("list_instances", "eu-de")) is None
+        assert cache.get(("list_regions",)) == 3
+        assert cache.get("list_instances") == 4
+
+    def test_invalidate_all(self):
+        cache = TTLCache()
+        cache.set(("list_regions",), 1, ttl=60)
+        cache.set("other", 2, ttl=60)
+        cache.invalidate()
+        assert cache.get_stale(("list_regions",)) is None
+        assert cache.get_stale("other") is None
@@ -0,0 +1,24 @@
+"""Tests for the shared HTTP session factory"""
+from blueterm.api.http import IAM_TOKEN_URL, create_session
+
+
+def _retry_for(url):
+    return create_session().get_adapter(url).max_retries
+
+
+class TestCreateSession:
+    def test_iam_token_post_is_retried(self):
+        retry = _retry_for(IAM_TOKEN_URL)
+        assert "POST" in retry.allowed_methods
+
+    def test_instance_action_post_is_not_retried(self):
+        # VpcV1 services share this session; start/stop/reboot are POSTs
+        retry = _retry_for(
+            "https://us-south.iaas.cloud.ibm.com/v1/instances/inst-001/actions"
+        )
+        assert "POST" not in retry.allowed_methods
+        assert "GET" in retry.allowed_methods
+
+    def test_other_iam_endpoints_only_retry_get(self):
+        retry = _retry_for("https://iam.cloud.ibm.com/v1/apikeys/details")
+        assert tuple(retry.allowed_methods) == ("GET",)
@@ -0,0 +1,155 @@
+"""Tests for the targeted instance refresh after a lifecycle action"""
+import asyncio
+import inspect
+from collections import Counter
+
+import pytest
+
+from blueterm.api.models import Instance, InstanceStatus, Region
+from blueterm.app import BluetermApp
+
+# The worker body, without Textual's @work and the API slot wrapper
+refresh_instance = inspect.unwrap(BluetermApp._refresh_instance)
+
+US_SOUTH = Region("us-south", "https://us-south.iaas.cloud.ibm.com", "available")
+EU_DE = Region("eu-de", "https://eu-de.iaas.cloud.ibm.com", "available")
+
+
+def make_instance(id: str, name: str, status: InstanceStatus = InstanceStatus.RUNNING) -> Instance:
+    return Instance(
+        id=id,
+        name=name,
+        status=status,
+        zone="us-south-1",
+        vpc_name="my-vpc",
+        vpc_id="vpc-001",
+        profile="bx2-2x8",
+        primary_ip="10.0.0.1",
+        created_at="2024-01-01T00:00:00Z",
+        crn=f"crn:v1:bluemix:public:is:us-south-1::{id}",
+    )
+
+
+class FakeClient:
+    """Returns a preset instance from get_instance, or raises"""
+
+    def __init__(self):
+        self.instance = None
+        self.error = None
+        self.calls = []
+
+    async def get_instance(self, instance_id, force_refresh=False):
+        self.calls.append(instance_id)
+        if self.error is not None:
+            raise self.error
+        return self.instance
+
+
+class FakeTable:
+    """Records how the instance table was redrawn"""
+
+    def __init__(self):
+        self.updated_rows = []
+        self.redraws = []
+
+    def update_row(self, instance):
+        self.updated_rows.append(instance)
+
+    def update_instances(self, instances):
+        self.redraws.append(list(instances))
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+@pytest.fixture
+def table():
+    return FakeTable()
+
+
+@pytest.fixture
+def app(client, table):
+    """BluetermApp with the state _refresh_instance touches (not mounted)"""
+    app = BluetermApp.__new__(BluetermApp)
+    app.current_region = US_SOUTH
+    app.client = client
+    app.instances = [
+        make_instance("inst-1", "web-1"),
+        make_instance("inst-2", "web-2"),
+        make_instance("inst-3", "db-1", InstanceStatus.STOPPED),
+    ]
+    app.filtered_instances = app.instances
+    app.search_query = ""
+    app._build_search_index()
+    app._status_counts = Counter(inst.status.value for inst in app.instances)
+    app._instance_table = table
+    app.full_reloads = 0
+
+    def load_instances():
+        app.full_reloads += 1
+
+    app.load_instances = load_instances
+    app._show_status_counts = lambda: None
+    app._refresh_action_bar = lambda: None
+    return app
+
+
+def search(app: BluetermApp, query: str) -> None:
+    app.search_query = query
+    app.apply_search_filter()
+
+
+def refresh(app: BluetermApp, instance_id: str, region: Region = US_SOUTH) -> None:
+    asyncio.run(refresh_instance(app, instance_id, region))
+
+
+class TestRefreshInstance:
+    def test_replaces_instance_and_adjusts_status_counts(self, app, client, table):
+        stopped = make_instance("inst-2", "web-2", InstanceStatus.STOPPED)
+        client.instance = stopped
+        refresh(app, "inst-2")
+        assert app.instances[1] is stopped
+        assert app._status_counts["running"] == 1
+        assert app._status_counts["stopped"] == 2
+
+    def test_updates_one_row_when_search_results_unchanged(self, app, client, table):
+        search(app, "web")
+        client.instance = make_instance("inst-2", "web-2", InstanceStatus.STOPPED)
+        refresh(app, "inst-2")
+        assert table.updated_rows == [client.instance]
+        assert table.redraws == []
+
+    def test_redraws_when_status_moves_instance_out_of_results(self, app, client, table):
+        search(app, "running")
+        client.instance = make_instance("inst-2", "web-2", InstanceStatus.STOPPED)
+        refresh(app, "inst-2")
+        assert table.updated_rows == []
+        assert [[inst.id for inst in shown] for shown in table.redraws] == [["inst-1"]]
+
+    def test_redraws_when_status_moves_instance_into_results(self, app, client, table):
+        search(app, "stopped")
+        client.instance = make_instance("inst-2", "web-2", InstanceStatus.STOPPED)
+        refresh(app, "inst-2")
+        assert [[inst.id for inst in shown] for shown in table.redraws] == [["inst-2", "inst-3"]]
+
+    def test_falls_back_to_full_reload_when_fetch_fails(self, app, client, table):
+        client.error = RuntimeError("instance not found")
+        refresh(app, "inst-2")
+        assert app.full_reloads == 1
+        assert table.updated_rows == []
+        assert table.redraws == []
+
+    def test_skipped_when_region_changed_since_action(self, app, client, table):
+        app.current_region = EU_DE
+        refresh(app, "inst-2", region=US_SOUTH)
+        assert client.calls == []
+        assert app.full_reloads == 0
+
+    def test_ignores_instance_no_longer_listed(self, app, client, table):
+        client.instance = make_instance("inst-9", "gone", InstanceStatus.STOPPED)
+        refresh(app, "inst-9")
+        assert app._status_counts == Counter({"running": 2, "stopped": 1})
+        assert table.updated_rows == []
+        assert table.redraws == []
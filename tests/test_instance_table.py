@@ -283,3 +283,44 @@ async def test_iks_update_parses_workers_pools():
         table.update_instances([cluster])
         await pilot.pause()
         assert table.row_count == 1
+
+
+@pytest.mark.asyncio
+async def test_update_row_changes_only_that_row_and_keeps_cursor():
+    async with TableApp().run_test() as pilot:
+        table = pilot.app.query_one(InstanceTable)
+        instances = [
+            make_instance(id="inst-1", name="server-1"),
+            make_instance(id="inst-2", name="server-2"),
+            make_instance(id="inst-3", name="server-3"),
+        ]
+        table.update_instances(instances)
+        table.move_cursor(row=2)
+        await pilot.pause()
+        before = {key: table.get_row(key) for key in ("inst-1", "inst-3")}
+
+        stopped = make_instance(id="inst-2", name="server-2", status=InstanceStatus.STOPPED)
+        table.update_row(stopped)
+        await pilot.pause()
+
+        assert table.get_cell("inst-2", "status").plain == stopped.status_display
+        assert {key: table.get_row(key) for key in ("inst-1", "inst-3")} == before
+        assert table.cursor_row == 2
+        assert table.row_count == 3
+        assert table.instances == [instances[0], stopped, instances[2]]
+        assert table.instances[1] is stopped
+
+
+@pytest.mark.asyncio
+async def test_update_row_unknown_instance_is_noop():
+    async with TableApp().run_test() as pilot:
+        table = pilot.app.query_one(InstanceTable)
+        instances = [make_instance(id="inst-1", name="server-1")]
+        table.update_instances(instances)
+        await pilot.pause()
+
+        table.update_row(make_instance(id="inst-9", status=InstanceStatus.STOPPED))
+        await pilot.pause()
+
+        assert table.instances == instances
+        assert table.row_count == 1
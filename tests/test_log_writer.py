@@ -0,0 +1,138 @@
+"""Tests for BufferedLogWriter"""
+import asyncio
+
+import requests
+from icecream import ic
+
+from blueterm import log_writer
+from blueterm.__main__ import setup_logging
+from blueterm.api.code_engine_client import CodeEngineClient
+from blueterm.log_writer import BufferedLogWriter
+
+
+def read_lines(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+class TestBufferedLogWriter:
+    def test_creates_directory_and_writes_lines_in_order(self, tmp_path):
+        log_file = tmp_path / "logs" / "blueterm.log"
+        writer = BufferedLogWriter(log_file)
+        writer.write("first")
+        writer.write("second")
+        writer.close()
+        assert read_lines(log_file) == ["first", "second"]
+
+    def test_writes_every_line_to_every_file(self, tmp_path):
+        paths = [tmp_path / "a.log", tmp_path / "b.log"]
+        writer = BufferedLogWriter(*paths)
+        writer.write("hello")
+        writer.close()
+        assert [read_lines(path) for path in paths] == [["hello"], ["hello"]]
+
+    def test_appends_to_existing_file(self, tmp_path):
+        log_file = tmp_path / "blueterm.log"
+        log_file.write_text("old\n", encoding="utf-8")
+        writer = BufferedLogWriter(log_file)
+        writer.write("new")
+        writer.close()
+        assert read_lines(log_file) == ["old", "new"]
+
+    def test_no_file_created_without_writes(self, tmp_path):
+        log_file = tmp_path / "blueterm.log"
+        writer = BufferedLogWriter(log_file)
+        writer.close()
+        assert not log_file.exists()
+
+    def test_writes_after_close_are_ignored(self, tmp_path):
+        log_file = tmp_path / "blueterm.log"
+        writer = BufferedLogWriter(log_file)
+        writer.write("kept")
+        writer.close()
+        writer.write("dropped")
+        writer.close()
+        assert read_lines(log_file) == ["kept"]
+
+
+class TestDedup:
+    def test_repeats_within_window_are_summarised_on_close(self, tmp_path):
+        log_file = tmp_path / "blueterm.log"
+        writer = BufferedLogWriter(log_file)
+        for _ in range(4):
+            writer.write("ic| retrying")
+        writer.write("other")
+        writer.close()
+        assert read_lines(log_file) == [
+            "ic| retrying",
+            "other",
+            "(suppressed 3 repeats of: ic| retrying)",
+        ]
+
+    def test_repeat_after_window_is_written_with_summary(self, tmp_path, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr("blueterm.log_writer.time.monotonic", lambda: clock[0])
+        log_file = tmp_path / "blueterm.log"
+        writer = BufferedLogWriter(log_file)
+        writer.write("ic| tick")
+        writer.write("ic| tick")
+        clock[0] += BufferedLogWriter.DEDUP_WINDOW
+        writer.write("ic| tick")
+        writer.close()
+        assert read_lines(log_file) == [
+            "ic| tick",
+            "(suppressed 1 repeats of: ic| tick)",
+            "ic| tick",
+        ]
+
+    def test_distinct_lines_are_never_dropped(self, tmp_path):
+        log_file = tmp_path / "blueterm.log"
+        writer = BufferedLogWriter(log_file)
+        lines = [f"ic| line {i}" for i in range(10)]
+        for line in lines:
+            writer.write(line)
+        writer.close()
+        assert read_lines(log_file) == lines
+
+    def test_pruning_reports_expired_repeats(self, tmp_path, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr("blueterm.log_writer.time.monotonic", lambda: clock[0])
+        monkeypatch.setattr(BufferedLogWriter, "DEDUP_MAX_ENTRIES", 2)
+        log_file = tmp_path / "blueterm.log"
+        writer = BufferedLogWriter(log_file)
+        writer.write("a")
+        writer.write("a")
+        writer.write("b")
+        clock[0] += BufferedLogWriter.DEDUP_WINDOW + 1
+        writer.write("c")
+        writer.close()
+        assert read_lines(log_file) == ["a", "b", "(suppressed 1 repeats of: a)", "c"]
+
+
+class TestReleaseLogging:
+    """Errors must reach blueterm.log, deduplicated, with ic() disabled"""
+
+    class UnreachableSession:
+        """Session whose every request fails, as during an IAM outage"""
+
+        def post(self, *args, **kwargs):
+            raise requests.exceptions.ConnectionError("IAM unavailable")
+
+        get = post
+
+    def test_repeated_error_is_deduplicated_when_debug_is_off(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(log_writer, "_log_writer", None)
+        enabled = ic.enabled
+        try:
+            log_file = setup_logging(debug=False)
+            client = CodeEngineClient("api-key", session=self.UnreachableSession())
+            for _ in range(3):
+                assert asyncio.run(client._fetch_projects_raw(force_refresh=True)) == []
+            log_writer._log_writer.close()
+        finally:
+            ic.enabled = enabled
+
+        lines = read_lines(log_file)
+        errors = [line for line in lines if line.startswith("Error fetching Code Engine projects")]
+        assert len(errors) == 1
+        assert lines[-1] == f"(suppressed 2 repeats of: {errors[0]})"
@@ -0,0 +1,44 @@
+"""Tests for the API data models"""
+from blueterm.api.models import Instance, InstanceStatus, ResourceGroup
+
+
+def make_instance(**overrides) -> Instance:
+    fields = dict(
+        id="inst-001",
+        name="my-server",
+        status=InstanceStatus.RUNNING,
+        zone="us-south-1",
+        vpc_name="my-vpc",
+        vpc_id="vpc-001",
+        profile="bx2-2x8",
+        primary_ip="10.0.0.1",
+        created_at="2024-01-01T00:00:00Z",
+        crn="crn:v1:bluemix:public:is:us-south-1::inst-001",
+    )
+    fields.update(overrides)
+    return Instance(**fields)
+
+
+class TestInterning:
+    def test_instance_strings_are_interned(self):
+        # Build the values at runtime so they are distinct objects
+        first = make_instance(zone="".join(["us-south", "-1"]), profile="".join(["bx2", "-2x8"]))
+        second = make_instance(zone="".join(["us-south", "-1"]), profile="".join(["bx2", "-2x8"]))
+        assert first.zone is second.zone
+        assert first.profile is second.profile
+
+    def test_instance_null_fields_are_kept(self):
+        # Null JSON fields (e.g. a Code Engine project without a region)
+        instance = make_instance(zone=None, vpc_name=None, profile=None)
+        assert instance.zone is None
+        assert instance.vpc_name is None
+        assert instance.profile is None
+
+    def test_resource_group_state_is_interned(self):
+        first = ResourceGroup(id="rg-1", name="default", state="".join(["act", "ive"]), crn="crn-1")
+        second = ResourceGroup(id="rg-2", name="dev", state="".join(["act", "ive"]), crn="crn-2")
+        assert first.state is second.state
+
+    def test_resource_group_null_state_is_kept(self):
+        group = ResourceGroup(id="rg-1", name="default", state=None, crn="crn-1")
+        assert group.state is None
@@ -0,0 +1,94 @@
+"""Tests for coalesced instance refreshes in BluetermApp"""
+import pytest
+
+from blueterm.app import BluetermApp
+
+
+class Recorder:
+    """Timers started, loads requested and whether a load is in flight"""
+
+    def __init__(self):
+        self.timers = []
+        self.loads = []
+        self.loading = False
+
+    def set_timer(self, delay, callback):
+        self.timers.append(callback)
+        return object()
+
+    def load_instances(self, force_refresh=False):
+        self.loads.append(force_refresh)
+
+    def instances_loading(self):
+        return self.loading
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture
+def app(recorder):
+    """BluetermApp with only the refresh state set up (not mounted)"""
+    app = BluetermApp.__new__(BluetermApp)
+    app._refresh_pending_timer = None
+    app._refresh_force = False
+    app._refresh_manual = False
+    app.set_timer = recorder.set_timer
+    app.load_instances = recorder.load_instances
+    app._instances_loading = recorder.instances_loading
+    return app
+
+
+def flush(recorder: Recorder) -> None:
+    """Fire the pending coalescing timer"""
+    callback = recorder.timers.pop()
+    assert not recorder.timers
+    callback()
+
+
+class TestRequestRefresh:
+    def test_requests_in_window_become_one_load(self, app, recorder):
+        app._request_refresh()
+        app._request_refresh(force_refresh=True, automatic=True)
+        app.action_refresh()
+        assert len(recorder.timers) == 1
+        flush(recorder)
+        assert recorder.loads == [True]
+
+    def test_unforced_requests_load_from_cache(self, app, recorder):
+        app._request_refresh()
+        flush(recorder)
+        assert recorder.loads == [False]
+
+    def test_state_resets_after_flush(self, app, recorder):
+        app.action_refresh()
+        flush(recorder)
+        app._request_refresh(automatic=True)
+        recorder.loading = True
+        flush(recorder)
+        assert recorder.loads == [True]
+
+    def test_auto_refresh_skipped_when_load_started_before_flush(self, app, recorder):
+        app._auto_refresh_tick()
+        recorder.loading = True
+        flush(recorder)
+        assert recorder.loads == []
+
+    def test_auto_refresh_tick_skipped_while_loading(self, app, recorder):
+        recorder.loading = True
+        app._auto_refresh_tick()
+        assert recorder.timers == []
+
+    def test_auto_refresh_runs_when_idle(self, app, recorder):
+        app._auto_refresh_tick()
+        flush(recorder)
+        assert recorder.loads == [True]
+
+    def test_manual_refresh_replaces_load_in_flight(self, app, recorder):
+        app._auto_refresh_tick()
+        app.action_refresh()
+        recorder.loading = True
+        flush(recorder)
+        assert recorder.loads == [True]
@@ -0,0 +1,78 @@
+"""Tests for the incremental search filter in BluetermApp"""
+import pytest
+
+from blueterm.api.models import Instance, InstanceStatus
+from blueterm.app import BluetermApp
+
+
+def make_instance(id: str, name: str, status: InstanceStatus = InstanceStatus.RUNNING) -> Instance:
+    return Instance(
+        id=id,
+        name=name,
+        status=status,
+        zone="us-south-1",
+        vpc_name="my-vpc",
+        vpc_id="vpc-001",
+        profile="bx2-2x8",
+        primary_ip="10.0.0.1",
+        created_at="2024-01-01T00:00:00Z",
+        crn=f"crn:v1:bluemix:public:is:us-south-1::{id}",
+    )
+
+
+@pytest.fixture
+def app():
+    """BluetermApp with only the search state set up (not mounted)"""
+    app = BluetermApp.__new__(BluetermApp)
+    app.instances = [
+        make_instance("inst-1", "web-server-1"),
+        make_instance("inst-2", "web-server-2", InstanceStatus.STOPPED),
+        make_instance("inst-3", "DB-Primary"),
+        make_instance("inst-4", "worker", InstanceStatus.STOPPED),
+    ]
+    app.filtered_instances = app.instances
+    app.search_query = ""
+    app._build_search_index()
+    return app
+
+
+def search(app: BluetermApp, query: str) -> list:
+    app.search_query = query
+    app.apply_search_filter()
+    return [inst.id for inst in app.filtered_instances]
+
+
+class TestApplySearchFilter:
+    def test_empty_query_shows_all_instances(self, app):
+        search(app, "web")
+        search(app, "")
+        assert app.filtered_instances is app.instances
+
+    def test_matches_name_substring(self, app):
+        assert search(app, "server") == ["inst-1", "inst-2"]
+
+    def test_matches_status(self, app):
+        assert search(app, "stopped") == ["inst-2", "inst-4"]
+
+    def test_casefolded_match(self, app):
+        assert search(app, "db-PRIMARY") == ["inst-3"]
+
+    def test_query_does_not_match_across_name_and_status(self, app):
+        assert search(app, "workerstopped") == []
+
+    def test_typing_narrows_previous_matches(self, app):
+        assert search(app, "w") == ["inst-1", "inst-2", "inst-4"]
+        assert search(app, "we") == ["inst-1", "inst-2"]
+        assert search(app, "web-server-2") == ["inst-2"]
+
+    def test_non_prefix_query_rescans_full_index(self, app):
+        assert search(app, "web") == ["inst-1", "inst-2"]
+        # Not an extension of "web": instances outside the last matches return
+        assert search(app, "wor") == ["inst-4"]
+        assert search(app, "w") == ["inst-1", "inst-2", "inst-4"]
+
+    def test_rebuilding_index_resets_incremental_state(self, app):
+        search(app, "web")
+        app.instances = app.instances + [make_instance("inst-5", "web-cache")]
+        app._build_search_index()
+        assert search(app, "web-") == ["inst-1", "inst-2", "inst-5"]